@@ -14,10 +14,21 @@
 
 """Shared utilities for audit tools."""
 
+import asyncio
+import functools
+import heapq
 import json
 import os
 import re
 import tempfile
+import threading
+from .utils import (
+    calculate_name_similarity,
+    get_bool_env,
+    get_positive_int_env,
+    ttl_cached,
+)
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from loguru import logger
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -25,203 +36,262 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Constants
 DEFAULT_BATCH_SIZE = 5
+AUDIT_CONCURRENCY = get_positive_int_env('MCP_AUDIT_CONCURRENCY', 5)  # Max batches in flight
 FUZZY_MATCH_THRESHOLD = 30  # Minimum similarity score for fuzzy matching
 HIGH_CONFIDENCE_MATCH_THRESHOLD = 85  # High confidence threshold for exact fuzzy matches
+SERVICE_OPERATIONS_FETCH_WORKERS = 8  # Max concurrent list_service_operations calls
+LOG_PRETTY_JSON = get_bool_env('MCP_LOG_PRETTY')  # Indent JSON written to audit logs
 
 
-async def execute_audit_api(input_obj: Dict[str, Any], region: str, banner: str) -> str:
-    """Execute the Application Signals audit API call with the given input object."""
-    from .aws_clients import applicationsignals_client
+def _log_json(obj: Any) -> str:
+    """Serialize an object for the audit logs, compact unless MCP_LOG_PRETTY is enabled."""
+    if LOG_PRETTY_JSON:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(',', ':'), default=str)
 
-    # File log path
+
+def _log_json_reusing(obj: Dict[str, Any], key: str, value_json: str) -> str:
+    """Serialize a dict like _log_json, splicing in obj[key] already serialized by _log_json."""
+    placeholder = json.dumps(f'__{key}__')
+    text = _log_json({**obj, key: f'__{key}__'})
+    if LOG_PRETTY_JSON:
+        # The value sits one level deep, so indent its continuation lines to match
+        value_json = value_json.replace('\n', '\n  ')
+    return text.replace(placeholder, value_json, 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_log_path() -> str:
+    """Resolve the audit API log file path, creating its directory once per process."""
     desired_log_path = os.environ.get('AUDITOR_LOG_PATH', tempfile.gettempdir())
     try:
         if desired_log_path.endswith(os.sep) or os.path.isdir(desired_log_path):
             os.makedirs(desired_log_path, exist_ok=True)
-            log_path = os.path.join(desired_log_path, 'aws_api.log')
-        else:
-            os.makedirs(os.path.dirname(desired_log_path) or '.', exist_ok=True)
-            log_path = desired_log_path
+            return os.path.join(desired_log_path, 'aws_api.log')
+        os.makedirs(os.path.dirname(desired_log_path) or '.', exist_ok=True)
+        return desired_log_path
     except Exception:
         temp_dir = tempfile.gettempdir()
         os.makedirs(temp_dir, exist_ok=True)
-        log_path = os.path.join(temp_dir, 'aws_api.log')
+        return os.path.join(temp_dir, 'aws_api.log')
+
+
+async def execute_audit_api(input_obj: Dict[str, Any], region: str, banner: str) -> str:
+    """Execute the Application Signals audit API call with the given input object."""
+    from .aws_clients import applicationsignals_client, call_in_thread
+
+    # File log path
+    log_path = _resolve_log_path()
 
     # Process targets in batches if needed
     targets = input_obj.get('AuditTargets', [])
     batch_size = DEFAULT_BATCH_SIZE
-    target_batches = []
+    # Batch start offsets; an empty target list still makes a single call
+    batch_starts = range(0, max(len(targets), 1), batch_size)
+    total_batches = len(batch_starts)
 
     if len(targets) > batch_size:
         logger.info(f'Processing {len(targets)} targets in batches of {batch_size}')
-        for i in range(0, len(targets), batch_size):
-            batch = targets[i : i + batch_size]
-            target_batches.append(batch)
-    else:
-        target_batches.append(targets)
 
-    all_batch_results = []
+    # Fields shared by every batch request, built once
+    base_input_obj: Dict[str, Any] = {
+        'StartTime': datetime.fromtimestamp(input_obj['StartTime'], tz=timezone.utc),
+        'EndTime': datetime.fromtimestamp(input_obj['EndTime'], tz=timezone.utc),
+    }
+    if 'Auditors' in input_obj:
+        base_input_obj['Auditors'] = input_obj['Auditors']
+    start_time_iso = base_input_obj['StartTime'].isoformat()
+    end_time_iso = base_input_obj['EndTime'].isoformat()
 
-    for batch_idx, batch_targets in enumerate(target_batches, 1):
-        logger.info(
-            f'Processing batch {batch_idx}/{len(target_batches)} with {len(batch_targets)} targets'
-        )
+    # Open the audit log once and share the handle across all batches
+    try:
+        log_file = await asyncio.to_thread(open, log_path, 'a')
+    except Exception as log_error:
+        logger.warning(f'Failed to write audit log to {log_path}: {log_error}')
+        log_file = None
+    log_lock = threading.Lock()
+
+    def _append_log(text: str) -> None:
+        """Write one block to the shared log file without interleaving other batches."""
+        with log_lock:
+            log_file.write(text)  # type: ignore[union-attr]
+
+    async def _write_log(text: str) -> None:
+        """Append a block of text to the audit log file off the event loop, if it is open."""
+        if log_file is None:
+            return
+        try:
+            await asyncio.to_thread(_append_log, text)
+        except Exception as log_error:
+            logger.warning(f'Failed to write audit log to {log_path}: {log_error}')
 
-        # Build API input for this batch
-        batch_input_obj = {
-            'StartTime': datetime.fromtimestamp(input_obj['StartTime'], tz=timezone.utc),
-            'EndTime': datetime.fromtimestamp(input_obj['EndTime'], tz=timezone.utc),
-            'AuditTargets': batch_targets,
-        }
-        if 'Auditors' in input_obj:
-            batch_input_obj['Auditors'] = input_obj['Auditors']
-
-        # Log API invocation details
-        api_pretty_input = json.dumps(
-            {
-                'StartTime': input_obj['StartTime'],
-                'EndTime': input_obj['EndTime'],
+    # Cap the number of audit API calls in flight at once
+    semaphore = asyncio.Semaphore(AUDIT_CONCURRENCY)
+
+    async def _run_one_batch(
+        batch_idx: int, batch_targets: List[dict]
+    ) -> Tuple[List[Any], Optional[Dict[str, Any]]]:
+        """Run list_audit_findings for a single batch and return (findings, error details)."""
+        async with semaphore:
+            logger.info(
+                f'Processing batch {batch_idx}/{total_batches} with {len(batch_targets)} targets'
+            )
+
+            # Build API input for this batch; batches run concurrently so each gets its own dict
+            batch_input_obj = {**base_input_obj, 'AuditTargets': batch_targets}
+
+            # Log API invocation details; the targets are serialized once and shared by the
+            # parameters block and the actual batch_input_obj that will be sent to AWS API
+            batch_targets_json = _log_json(batch_targets)
+            api_pretty_input = _log_json_reusing(
+                {
+                    'StartTime': input_obj['StartTime'],
+                    'EndTime': input_obj['EndTime'],
+                    'AuditTargets': batch_targets,
+                    'Auditors': input_obj.get('Auditors', []),
+                },
+                'AuditTargets',
+                batch_targets_json,
+            )
+
+            batch_input_for_logging = {
+                'StartTime': start_time_iso,
+                'EndTime': end_time_iso,
                 'AuditTargets': batch_targets,
-                'Auditors': input_obj.get('Auditors', []),
-            },
-            indent=2,
-        )
+            }
+            if 'Auditors' in base_input_obj:
+                batch_input_for_logging['Auditors'] = base_input_obj['Auditors']
 
-        # Also log the actual batch_input_obj that will be sent to AWS API
-        batch_input_for_logging = {
-            'StartTime': batch_input_obj['StartTime'].isoformat(),
-            'EndTime': batch_input_obj['EndTime'].isoformat(),
-            'AuditTargets': batch_input_obj['AuditTargets'],
-        }
-        if 'Auditors' in batch_input_obj:
-            batch_input_for_logging['Auditors'] = batch_input_obj['Auditors']
+            batch_payload_json = _log_json_reusing(
+                batch_input_for_logging, 'AuditTargets', batch_targets_json
+            )
 
-        batch_payload_json = json.dumps(batch_input_for_logging, indent=2)
+            logger.info('═' * 80)
+            logger.info(
+                f'BATCH {batch_idx}/{total_batches} - {datetime.now(timezone.utc).isoformat()}'
+            )
+            logger.info(banner.strip())
+            logger.info('---- API INVOCATION ----')
+            logger.info('applicationsignals_client.list_audit_findings()')
+            logger.info('---- API PARAMETERS (JSON) ----')
+            logger.info(api_pretty_input)
+            logger.info('---- ACTUAL AWS API PAYLOAD ----')
+            logger.info(batch_payload_json)
+            logger.info('---- END PARAMETERS ----')
+
+            # Write detailed payload to log file
+            await _write_log(
+                '═' * 80
+                + '\n'
+                + f'BATCH {batch_idx}/{total_batches} - {datetime.now(timezone.utc).isoformat()}\n'
+                + banner.strip()
+                + '\n'
+                + '---- API INVOCATION ----\n'
+                + 'applicationsignals_client.list_audit_findings()\n'
+                + '---- API PARAMETERS (JSON) ----\n'
+                + api_pretty_input
+                + '\n'
+                + '---- ACTUAL AWS API PAYLOAD ----\n'
+                + batch_payload_json
+                + '\n'
+                + '---- END PARAMETERS ----\n\n'
+            )
 
-        logger.info('═' * 80)
-        logger.info(
-            f'BATCH {batch_idx}/{len(target_batches)} - {datetime.now(timezone.utc).isoformat()}'
-        )
-        logger.info(banner.strip())
-        logger.info('---- API INVOCATION ----')
-        logger.info('applicationsignals_client.list_audit_findings()')
-        logger.info('---- API PARAMETERS (JSON) ----')
-        logger.info(api_pretty_input)
-        logger.info('---- ACTUAL AWS API PAYLOAD ----')
-        logger.info(batch_payload_json)
-        logger.info('---- END PARAMETERS ----')
-
-        # Write detailed payload to log file
-        try:
-            with open(log_path, 'a') as f:
-                f.write('═' * 80 + '\n')
-                f.write(
-                    f'BATCH {batch_idx}/{len(target_batches)} - {datetime.now(timezone.utc).isoformat()}\n'
+            # Call the Application Signals API for this batch off the event loop
+            try:
+                response = await call_in_thread(
+                    applicationsignals_client, 'list_audit_findings', **batch_input_obj
+                )
+            except Exception as e:
+                error_msg = str(e)
+                await _write_log(
+                    f'---- BATCH {batch_idx} API ERROR ----\n'
+                    + error_msg
+                    + '\n---- END ERROR ----\n\n'
+                )
+                logger.error(
+                    f'---- BATCH {batch_idx} API ERROR ----\n'
+                    + error_msg
+                    + '\n---- END ERROR ----'
                 )
-                f.write(banner.strip() + '\n')
-                f.write('---- API INVOCATION ----\n')
-                f.write('applicationsignals_client.list_audit_findings()\n')
-                f.write('---- API PARAMETERS (JSON) ----\n')
-                f.write(api_pretty_input + '\n')
-                f.write('---- ACTUAL AWS API PAYLOAD ----\n')
-                f.write(batch_payload_json + '\n')
-                f.write('---- END PARAMETERS ----\n\n')
-        except Exception as log_error:
-            logger.warning(f'Failed to write audit log to {log_path}: {log_error}')
 
-        # Call the Application Signals API for this batch
-        try:
-            response = applicationsignals_client.list_audit_findings(**batch_input_obj)  # type: ignore[attr-defined]
+                return [], {
+                    'error': f'API call failed: {error_msg}',
+                    'targets': batch_targets,
+                }
 
-            # Format and log output for this batch
-            observation_text = json.dumps(response, indent=2, default=str)
-            all_batch_results.append(response)
+            # Serialize the response for the logs; only the final result is always pretty-printed
+            observation_text = _log_json(response)
 
             if not response.get('AuditFindings'):
-                try:
-                    with open(log_path, 'a') as f:
-                        f.write(f'📭 Batch {batch_idx}: No findings returned.\n')
-                        f.write('---- END RESPONSE ----\n\n')
-                except Exception as log_error:
-                    logger.warning(f'Failed to write audit log to {log_path}: {log_error}')
+                await _write_log(
+                    f'📭 Batch {batch_idx}: No findings returned.\n---- END RESPONSE ----\n\n'
+                )
                 logger.info(f'📭 Batch {batch_idx}: No findings returned.\n---- END RESPONSE ----')
             else:
-                try:
-                    with open(log_path, 'a') as f:
-                        f.write(f'---- BATCH {batch_idx} API RESPONSE (JSON) ----\n')
-                        f.write(observation_text + '\n')
-                        f.write('---- END RESPONSE ----\n\n')
-                except Exception as log_error:
-                    logger.warning(f'Failed to write audit log to {log_path}: {log_error}')
+                await _write_log(
+                    f'---- BATCH {batch_idx} API RESPONSE (JSON) ----\n'
+                    + observation_text
+                    + '\n---- END RESPONSE ----\n\n'
+                )
                 logger.info(
                     f'---- BATCH {batch_idx} API RESPONSE (JSON) ----\n'
                     + observation_text
                     + '\n---- END RESPONSE ----'
                 )
 
-        except Exception as e:
-            error_msg = str(e)
+            return response.get('AuditFindings', []), None
+
+    # Run all batches concurrently; results come back in batch order
+    try:
+        batch_outcomes = await asyncio.gather(
+            *[
+                _run_one_batch(batch_idx, targets[start : start + batch_size])
+                for batch_idx, start in enumerate(batch_starts, 1)
+            ],
+            return_exceptions=True,
+        )
+    finally:
+        if log_file is not None:
             try:
-                with open(log_path, 'a') as f:
-                    f.write(f'---- BATCH {batch_idx} API ERROR ----\n')
-                    f.write(error_msg + '\n')
-                    f.write('---- END ERROR ----\n\n')
+                log_file.close()
             except Exception as log_error:
-                logger.warning(f'Failed to write audit log to {log_path}: {log_error}')
-            logger.error(
-                f'---- BATCH {batch_idx} API ERROR ----\n' + error_msg + '\n---- END ERROR ----'
-            )
-
-            batch_error_result = {
-                'error': f'API call failed: {error_msg}',
-                'targets': batch_targets,
-            }
-            all_batch_results.append(batch_error_result)
-            continue
+                logger.warning(f'Failed to close audit log {log_path}: {log_error}')
 
-    # Aggregate results from all batches
-    if not all_batch_results:
-        return banner + 'Result: No findings from any batch.'
-
-    # Aggregate the findings from all successful batches
+    # Aggregate findings and errors from all batches in a single pass
     aggregated_findings = []
-    failed_batches = 0
-
-    for batch_idx, batch_result in enumerate(all_batch_results):
-        if isinstance(batch_result, dict):
-            if 'error' in batch_result:
-                failed_batches += 1
-                continue
-
-            batch_findings = batch_result.get('AuditFindings', [])
+    error_details = []
+    for start, outcome in zip(batch_starts, batch_outcomes):
+        if isinstance(outcome, BaseException):
+            error_details.append(
+                {
+                    'error': f'API call failed: {outcome}',
+                    'targets': targets[start : start + batch_size],
+                }
+            )
+        else:
+            batch_findings, batch_error = outcome
             aggregated_findings.extend(batch_findings)
+            if batch_error is not None:
+                error_details.append(batch_error)
 
     # Create final aggregated response
-    final_result = {
+    final_result: Dict[str, Any] = {
         'AuditFindings': aggregated_findings,
     }
 
     # Add any error information if there were failed batches
-    if failed_batches > 0:
-        error_details = []
-        for batch_result in all_batch_results:
-            if isinstance(batch_result, dict) and 'error' in batch_result:
-                error_details.append(
-                    {
-                        'error': batch_result['error'],
-                        'targets': batch_result['targets'],
-                    }
-                )
+    if error_details:
         final_result['ListAuditFindingsErrors'] = error_details
 
     final_observation_text = json.dumps(final_result, indent=2, default=str)
     return banner + final_observation_text
 
 
-def _create_service_target(
+def _create_service_config(
     service_name: str, environment: str, aws_account_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Create a standardized service target configuration."""
+    """Create the Service block shared by service and service_operation targets."""
     service_config = {
         'Type': 'Service',
         'Name': service_name,
@@ -229,13 +299,48 @@ def _create_service_target(
     }
     if aws_account_id:
         service_config['AwsAccountId'] = aws_account_id
+    return service_config
+
 
+def _create_service_target(
+    service_name: str, environment: str, aws_account_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Create a standardized service target configuration."""
     return {
         'Type': 'service',
-        'Data': {'Service': service_config},
+        'Data': {'Service': _create_service_config(service_name, environment, aws_account_id)},
     }
 
 
+def _create_service_operation_target(
+    service_name: str, environment: str, operation: str, metric_type: str
+) -> Dict[str, Any]:
+    """Create a standardized service_operation target configuration."""
+    return {
+        'Type': 'service_operation',
+        'Data': {
+            'ServiceOperation': {
+                'Service': _create_service_config(service_name, environment),
+                'Operation': operation,
+                'MetricType': metric_type,
+            }
+        },
+    }
+
+
+def _create_slo_target(slo_name: str, slo_arn: str) -> Dict[str, Any]:
+    """Create a standardized SLO target configuration."""
+    return {
+        'Type': 'slo',
+        'Data': {'Slo': {'SloName': slo_name, 'SloArn': slo_arn}},
+    }
+
+
+def _service_identity(service: Dict[str, Any]) -> Tuple:
+    """Return a hashable key identifying a service summary by its KeyAttributes."""
+    return tuple(sorted(service.get('KeyAttributes', {}).items()))
+
+
 def _filter_instrumented_services(all_services: List[Any]) -> List[Dict[str, Any]]:
     """Filter out uninstrumented and aws native services.
 
@@ -255,7 +360,10 @@ def _filter_instrumented_services(all_services: List[Any]) -> List[Dict[str, Any
         # Filter out services without proper names or that are not actual services
         if not service_name or service_name == 'Unknown' or service_type != 'Service':
             logger.debug(
-                f"Skipping service: Name='{service_name}', Type='{service_type}', Environment='{environment}'"
+                "Skipping service: Name='{}', Type='{}', Environment='{}'",
+                service_name,
+                service_type,
+                environment,
             )
             continue
 
@@ -272,14 +380,18 @@ def _filter_instrumented_services(all_services: List[Any]) -> List[Dict[str, Any
                 ):
                     is_instrumented = False
                     logger.debug(
-                        f"Filtering out uninstrumented service: Name='{service_name}', InstrumentationType='{instrumentation_type}'"
+                        "Filtering out uninstrumented service: Name='{}', InstrumentationType='{}'",
+                        service_name,
+                        instrumentation_type,
                     )
                     break
 
         if is_instrumented:
             instrumented_services.append(service)
             logger.debug(
-                f"Including instrumented service: Name='{service_name}', Environment='{environment}'"
+                "Including instrumented service: Name='{}', Environment='{}'",
+                service_name,
+                environment,
             )
 
     logger.info(
@@ -320,12 +432,16 @@ def _fetch_instrumented_services_with_pagination(
     instrumented_services = []
     returned_next_token = None
 
+    # The time window is the same for every page, so convert it once
+    start_dt = datetime.fromtimestamp(unix_start, tz=timezone.utc)
+    end_dt = datetime.fromtimestamp(unix_end, tz=timezone.utc)
+
     # Loop until we find instrumented services or run out of pages
     while True:
         # Build list_services parameters
         list_services_params = {
-            'StartTime': datetime.fromtimestamp(unix_start, tz=timezone.utc),
-            'EndTime': datetime.fromtimestamp(unix_end, tz=timezone.utc),
+            'StartTime': start_dt,
+            'EndTime': end_dt,
             'MaxResults': max_results,
         }
 
@@ -335,7 +451,18 @@ def _fetch_instrumented_services_with_pagination(
 
         logger.info(f'Fetching batch (viewed so far: {total_services_viewed} services)')
 
-        services_response = applicationsignals_client.list_services(**list_services_params)
+        # Cache by minute so repeated expansions within the TTL share one API call
+        services_response = ttl_cached(
+            (
+                'list_services',
+                applicationsignals_client,
+                unix_start // 60,
+                unix_end // 60,
+                max_results,
+                current_next_token,
+            ),
+            lambda: applicationsignals_client.list_services(**list_services_params),
+        )
         services_batch = services_response.get('ServiceSummaries', [])
         returned_next_token = services_response.get('NextToken')
 
@@ -391,6 +518,25 @@ def _fetch_instrumented_services_with_pagination(
     return (instrumented_services, returned_next_token, all_service_names, filtering_stats)
 
 
+def dedupe_audit_targets(targets: List[dict]) -> List[dict]:
+    """Drop repeated audit targets, keeping the first occurrence of each.
+
+    Overlapping wildcard patterns (e.g. '*payment*' and '*') or repeated user input can yield
+    the same target more than once; auditing it again only costs extra API calls.
+    """
+    seen = set()
+    deduped = []
+    for target in targets:
+        key = json.dumps(target, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            deduped.append(target)
+
+    if len(deduped) < len(targets):
+        logger.debug('Dropped {} duplicate audit targets', len(targets) - len(deduped))
+    return deduped
+
+
 def parse_auditors(
     auditors_value: Union[str, None, Any], default_auditors: List[str]
 ) -> List[str]:
@@ -430,6 +576,32 @@ def parse_auditors(
         return raw_a
 
 
+def _get_service_target_name(target: dict) -> Any:
+    """Return the service name of a service target from Data.Service.Name or shorthand Service."""
+    service_name = None
+
+    # Check Data.Service.Name (full format)
+    service_data = target.get('Data', {})
+    if isinstance(service_data, dict):
+        service_info = service_data.get('Service', {})
+        if isinstance(service_info, dict):
+            service_name = service_info.get('Name', '')
+
+    # Check shorthand Service field
+    if not service_name:
+        service_name = target.get('Service', '')
+
+    return service_name
+
+
+def _has_target_type(targets: List[dict], target_type: str) -> bool:
+    """Check whether any dict target has the given (case-insensitive) type."""
+    return any(
+        isinstance(target, dict) and target.get('Type', '').lower() == target_type
+        for target in targets
+    )
+
+
 def expand_service_wildcard_patterns(
     targets: List[dict],
     unix_start: int,
@@ -452,69 +624,61 @@ def expand_service_wildcard_patterns(
         Tuple of (expanded_targets, next_token, all_service_names, filtering_stats)
         filtering_stats contains: {'total_services': int, 'instrumented_services': int, 'filtered_out': int}
     """
-    from .utils import calculate_name_similarity
+    filtering_stats = {'total_services': 0, 'instrumented_services': 0, 'filtered_out': 0}
 
-    if applicationsignals_client is None:
-        from .aws_clients import applicationsignals_client
+    # Nothing to expand or fuzzy match without service targets
+    if not _has_target_type(targets, 'service'):
+        return list(targets), None, [], filtering_stats
 
     expanded_targets = []
     service_patterns = []
     service_fuzzy_matches = []
     all_service_names = []
-    filtering_stats = {'total_services': 0, 'instrumented_services': 0, 'filtered_out': 0}
 
     logger.debug(
-        f'expand_service_wildcard_patterns_paginated: Processing {len(targets)} targets with max_results={max_results}'
+        'expand_service_wildcard_patterns_paginated: Processing {} targets with max_results={}',
+        len(targets),
+        max_results,
     )
-    logger.debug(f'Received next_token: {next_token is not None}')
+    logger.debug('Received next_token: {}', next_token is not None)
 
     # First pass: identify patterns and collect non-wildcard targets
     for i, target in enumerate(targets):
-        logger.debug(f'Target {i}: {target}')
+        logger.debug('Target {}: {}', i, target)
 
         if not isinstance(target, dict):
             expanded_targets.append(target)
             continue
 
         target_type = target.get('Type', '').lower()
-        logger.debug(f'Target {i} type: {target_type}')
+        logger.debug('Target {} type: {}', i, target_type)
 
         if target_type == 'service':
-            # Check multiple possible locations for service name
-            service_name = None
-
-            # Check Data.Service.Name (full format)
-            service_data = target.get('Data', {})
-            if isinstance(service_data, dict):
-                service_info = service_data.get('Service', {})
-                if isinstance(service_info, dict):
-                    service_name = service_info.get('Name', '')
-
-            # Check shorthand Service field
-            if not service_name:
-                service_name = target.get('Service', '')
-
-            logger.debug(f"Target {i} service name: '{service_name}'")
+            service_name = _get_service_target_name(target)
+            logger.debug("Target {} service name: '{}'", i, service_name)
 
             if isinstance(service_name, str) and service_name:
                 if '*' in service_name:
-                    logger.debug(f"Target {i} identified as wildcard pattern: '{service_name}'")
+                    logger.debug("Target {} identified as wildcard pattern: '{}'", i, service_name)
                     service_patterns.append((target, service_name))
                 else:
                     # Check if this might be a fuzzy match candidate
                     service_fuzzy_matches.append((target, service_name))
             else:
-                logger.debug(f'Target {i} has no valid service name, passing through')
+                logger.debug('Target {} has no valid service name, passing through', i)
                 expanded_targets.append(target)
         else:
             # Non-service targets pass through unchanged
-            logger.debug(f'Target {i} is not a service target, passing through')
+            logger.debug('Target {} is not a service target, passing through', i)
             expanded_targets.append(target)
 
-    # Expand service patterns and fuzzy matches with pagination
+    # Expand service patterns and fuzzy matches with pagination; the pagination helper
+    # resolves the default client, so explicit-only targets never construct it
     if service_patterns or service_fuzzy_matches:
         logger.debug(
-            f'Expanding {len(service_patterns)} service wildcard patterns and {len(service_fuzzy_matches)} fuzzy matches with pagination'
+            'Expanding {} service wildcard patterns and {} fuzzy matches with pagination',
+            len(service_patterns),
+            len(service_fuzzy_matches),
         )
         try:
             # Use the common pagination function
@@ -524,47 +688,57 @@ def expand_service_wildcard_patterns(
                 )
             )
 
-            # Handle wildcard patterns
-            for original_target, pattern in service_patterns:
-                matches_found = 0
-                compiled_pattern = _compile_wildcard_pattern(pattern)
-                for service in instrumented_services:
-                    service_attrs = service.get('KeyAttributes', {})
-                    service_name = service_attrs.get('Name', '')
-                    environment = service_attrs.get('Environment', '')
-
-                    # Apply wildcard pattern matching
+            # Walk instrumented services once, matching every wildcard pattern and
+            # scoring every fuzzy name per service; per-pattern buckets keep output order
+            compiled_patterns = [
+                _compile_wildcard_pattern(pattern) for _, pattern in service_patterns
+            ]
+            pattern_matches: List[List[dict]] = [[] for _ in service_patterns]
+            fuzzy_candidates: List[List[tuple]] = [[] for _ in service_fuzzy_matches]
+
+            for service in instrumented_services:
+                service_attrs = service.get('KeyAttributes', {})
+                service_name = service_attrs.get('Name', '')
+                environment = service_attrs.get('Environment', '')
+
+                # Apply wildcard pattern matching
+                for idx, compiled_pattern in enumerate(compiled_patterns):
                     if _matches_wildcard_pattern(service_name, compiled_pattern):
-                        expanded_targets.append(_create_service_target(service_name, environment))
-                        matches_found += 1
+                        pattern_matches[idx].append(
+                            _create_service_target(service_name, environment)
+                        )
                         logger.debug(
-                            f"Added instrumented service: Name='{service_name}', Environment='{environment}'"
+                            "Added instrumented service: Name='{}', Environment='{}'",
+                            service_name,
+                            environment,
                         )
 
-                logger.debug(
-                    f"Service pattern '{pattern}' expanded to {matches_found} instrumented targets in this batch"
-                )
-
-            # Handle fuzzy matches for inexact service names
-            for original_target, inexact_name in service_fuzzy_matches:
-                best_matches = []
-
-                # Calculate similarity scores for all instrumented services
-                for service in instrumented_services:
-                    service_attrs = service.get('KeyAttributes', {})
-                    service_name = service_attrs.get('Name', '')
-                    if not service_name:
-                        continue
-
+                # Calculate similarity scores for inexact service names
+                if not service_name:
+                    continue
+                for idx, (_, inexact_name) in enumerate(service_fuzzy_matches):
                     score = calculate_name_similarity(inexact_name, service_name, 'service')
 
                     if score >= FUZZY_MATCH_THRESHOLD:  # Minimum threshold for consideration
-                        best_matches.append(
+                        fuzzy_candidates[idx].append(
                             (service_name, service_attrs.get('Environment'), score)
                         )
 
-                # Sort by score and take the best matches
-                best_matches.sort(key=lambda x: x[2], reverse=True)
+            # Handle wildcard patterns
+            for (original_target, pattern), matches in zip(service_patterns, pattern_matches):
+                expanded_targets.extend(matches)
+                logger.debug(
+                    "Service pattern '{}' expanded to {} instrumented targets in this batch",
+                    pattern,
+                    len(matches),
+                )
+
+            # Handle fuzzy matches for inexact service names
+            for (original_target, inexact_name), best_matches in zip(
+                service_fuzzy_matches, fuzzy_candidates
+            ):
+                # Keep only the top candidates by score (ties keep service order)
+                best_matches = heapq.nlargest(3, best_matches, key=lambda x: x[2])
 
                 if best_matches:
                     # If we have a very high score match, use only that
@@ -623,8 +797,9 @@ def expand_slo_wildcard_patterns(
     Returns:
         Tuple of (expanded_targets, next_token, slo_names_in_batch)
     """
-    if applicationsignals_client is None:
-        from .aws_clients import applicationsignals_client
+    # Nothing to expand without SLO targets
+    if not _has_target_type(targets, 'slo'):
+        return list(targets), None, []
 
     expanded_targets = []
     wildcard_patterns = []
@@ -662,9 +837,12 @@ def expand_slo_wildcard_patterns(
         else:
             expanded_targets.append(target)
 
-    # Expand wildcard patterns for SLOs
+    # Expand wildcard patterns for SLOs; the default client is only needed from here on
     if wildcard_patterns:
-        logger.debug(f'Expanding {len(wildcard_patterns)} SLO wildcard patterns')
+        if applicationsignals_client is None:
+            from .aws_clients import applicationsignals_client
+
+        logger.debug('Expanding {} SLO wildcard patterns', len(wildcard_patterns))
         try:
             list_slos_params = {
                 'MaxResults': max_results,
@@ -674,8 +852,16 @@ def expand_slo_wildcard_patterns(
             if next_token:
                 list_slos_params['NextToken'] = next_token
 
-            slos_response = applicationsignals_client.list_service_level_objectives(
-                **list_slos_params
+            slos_response = ttl_cached(
+                (
+                    'list_service_level_objectives',
+                    applicationsignals_client,
+                    max_results,
+                    next_token,
+                ),
+                lambda: applicationsignals_client.list_service_level_objectives(
+                    **list_slos_params
+                ),
             )
             slos_batch = slos_response.get('SloSummaries', [])
             returned_next_token = slos_response.get('NextToken')
@@ -685,24 +871,37 @@ def expand_slo_wildcard_patterns(
                 slo_name = slo.get('Name', '')
                 slo_names_in_batch.append(slo_name)
 
-            # Handle wildcard patterns
-            for original_target, pattern in wildcard_patterns:
-                matches_found = 0
-                compiled_pattern = _compile_wildcard_pattern(pattern)
-                for slo in slos_batch:
-                    slo_name = slo.get('Name', '')
-                    if _matches_wildcard_pattern(slo_name, compiled_pattern):
-                        expanded_targets.append(
-                            {
-                                'Type': 'slo',
-                                'Data': {
-                                    'Slo': {'SloName': slo_name, 'SloArn': slo.get('Arn', '')}
-                                },
-                            }
-                        )
-                        matches_found += 1
+            # Walk the SLO batch once, matching every wildcard pattern per SLO; per-pattern
+            # buckets keep output order and an SLO matched by several patterns is added once,
+            # to the first pattern it matches, while every pattern still counts it
+            compiled_patterns = [
+                _compile_wildcard_pattern(pattern) for _, pattern in wildcard_patterns
+            ]
+            pattern_matches: List[List[dict]] = [[] for _ in wildcard_patterns]
+            pattern_match_counts = [0] * len(wildcard_patterns)
 
-                logger.debug(f"SLO pattern '{pattern}' expanded to {matches_found} targets")
+            for slo in slos_batch:
+                slo_name = slo.get('Name', '')
+                added = False
+                for idx, compiled_pattern in enumerate(compiled_patterns):
+                    if _matches_wildcard_pattern(slo_name, compiled_pattern):
+                        pattern_match_counts[idx] += 1
+                        if not added:
+                            pattern_matches[idx].append(
+                                _create_slo_target(slo_name, slo.get('Arn', ''))
+                            )
+                            added = True
+
+            for (original_target, pattern), matches, match_count in zip(
+                wildcard_patterns, pattern_matches, pattern_match_counts
+            ):
+                expanded_targets.extend(matches)
+                logger.debug(
+                    "SLO pattern '{}' matched {} SLOs ({} new unique targets)",
+                    pattern,
+                    match_count,
+                    len(matches),
+                )
             return expanded_targets, returned_next_token, slo_names_in_batch
         except Exception as e:
             logger.warning(f'Failed to expand SLO patterns: {e}')
@@ -733,13 +932,15 @@ def expand_service_operation_wildcard_patterns(
         Tuple of (expanded_targets, next_token, all_service_names, filtering_stats)
         filtering_stats contains: {'total_services': int, 'instrumented_services': int, 'filtered_out': int}
     """
-    if applicationsignals_client is None:
-        from .aws_clients import applicationsignals_client
+    filtering_stats = {'total_services': 0, 'instrumented_services': 0, 'filtered_out': 0}
+
+    # Nothing to expand without service operation targets
+    if not _has_target_type(targets, 'service_operation'):
+        return list(targets), None, [], filtering_stats
 
     expanded_targets = []
     wildcard_patterns = []
     all_service_names = []
-    filtering_stats = {'total_services': 0, 'instrumented_services': 0, 'filtered_out': 0}
 
     for target in targets:
         if isinstance(target, dict):
@@ -761,10 +962,14 @@ def expand_service_operation_wildcard_patterns(
         else:
             expanded_targets.append(target)
 
-    # Expand wildcard patterns for service operations
+    # Expand wildcard patterns for service operations; the default client is only needed from here on
     if wildcard_patterns:
+        if applicationsignals_client is None:
+            from .aws_clients import applicationsignals_client
+
         logger.debug(
-            f'Expanding {len(wildcard_patterns)} service operation wildcard patterns with pagination'
+            'Expanding {} service operation wildcard patterns with pagination',
+            len(wildcard_patterns),
         )
         try:
             # Use the common pagination function
@@ -774,103 +979,141 @@ def expand_service_operation_wildcard_patterns(
                 )
             )
 
-            for original_target, service_pattern, operation_pattern in wildcard_patterns:
-                compiled_service_pattern = _compile_wildcard_pattern(service_pattern)
+            # Match every service pattern in a single walk over instrumented services,
+            # reading each service's name, environment and identity only once
+            compiled_service_patterns = [
+                _compile_wildcard_pattern(service_pattern)
+                for _, service_pattern, _ in wildcard_patterns
+            ]
+            matching_services_by_pattern: List[List[tuple]] = [[] for _ in wildcard_patterns]
+            for service in instrumented_services:
+                service_attrs = service.get('KeyAttributes', {})
+                service_entry = (
+                    service,
+                    service_attrs.get('Name', ''),
+                    service_attrs.get('Environment', ''),
+                    _service_identity(service),
+                )
+                for idx, compiled_service_pattern in enumerate(compiled_service_patterns):
+                    # Check if service matches the pattern using wildcard matching
+                    if _matches_wildcard_pattern(service_entry[1], compiled_service_pattern):
+                        matching_services_by_pattern[idx].append(service_entry)
+
+            start_dt = datetime.fromtimestamp(unix_start, tz=timezone.utc)
+            end_dt = datetime.fromtimestamp(unix_end, tz=timezone.utc)
+
+            def _fetch_operations(service: dict) -> Any:
+                """Fetch a service's operations as (name, casefolded metric types) tuples.
+
+                Returns the exception instead of raising so one failing service does not
+                abort the fan-out.
+                """
+                try:
+                    operations_response = applicationsignals_client.list_service_operations(
+                        StartTime=start_dt,
+                        EndTime=end_dt,
+                        KeyAttributes=service.get('KeyAttributes', {}),
+                        MaxResults=100,
+                    )
+                except Exception as e:
+                    return e
+
+                operations = []
+                for operation in operations_response.get('ServiceOperations', []):
+                    raw_metric_types = {
+                        ref.get('MetricType', '') for ref in operation.get('MetricReferences', [])
+                    }
+                    metric_types_cf = {mt.casefold() for mt in raw_metric_types}
+                    # Availability is backed by the FAULT metric
+                    if 'FAULT' in raw_metric_types:
+                        metric_types_cf.add('availability')
+                    operations.append((operation.get('Name', ''), frozenset(metric_types_cf)))
+                return operations
+
+            # Fetch operations once per unique service (by KeyAttributes), concurrently,
+            # and share them across all patterns
+            services_by_identity = {
+                identity: service
+                for matching_services in matching_services_by_pattern
+                for service, _, _, identity in matching_services
+            }
+            services_to_fetch = list(services_by_identity.values())
+            if len(services_to_fetch) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(SERVICE_OPERATIONS_FETCH_WORKERS, len(services_to_fetch))
+                ) as executor:
+                    fetched = list(executor.map(_fetch_operations, services_to_fetch))
+            else:
+                fetched = [_fetch_operations(service) for service in services_to_fetch]
+            operations_by_service = dict(zip(services_by_identity, fetched))
+
+            # Collect flat (service, environment, operation, metric type) records while
+            # matching and build the nested target dicts in one pass at the end
+            operation_records: List[Tuple[str, str, str, str]] = []
+
+            for (original_target, service_pattern, operation_pattern), matching_services in zip(
+                wildcard_patterns, matching_services_by_pattern
+            ):
                 compiled_operation_pattern = _compile_wildcard_pattern(operation_pattern)
                 matches_found = 0
 
                 # Get the original metric type from the pattern
                 service_op_data = original_target.get('Data', {}).get('ServiceOperation', {})
                 metric_type = service_op_data.get('MetricType', 'Latency')
-
-                # Find matching services from instrumented services only
-                matching_services = []
-                for service in instrumented_services:
-                    service_attrs = service.get('KeyAttributes', {})
-                    service_name = service_attrs.get('Name', '')
-
-                    # Check if service matches the pattern using wildcard matching
-                    if _matches_wildcard_pattern(service_name, compiled_service_pattern):
-                        matching_services.append(service)
+                metric_type_cf = metric_type.casefold()
 
                 logger.debug(
-                    f"Found {len(matching_services)} instrumented services matching pattern '{service_pattern}'"
+                    "Found {} instrumented services matching pattern '{}'",
+                    len(matching_services),
+                    service_pattern,
                 )
 
-                # For each matching service, get operations and expand operation patterns
-                for service in matching_services:
-                    service_attrs = service.get('KeyAttributes', {})
-                    service_name = service_attrs.get('Name', '')
-                    environment = service_attrs.get('Environment', '')
-
+                # For each matching service, expand operation patterns
+                for _, service_name, environment, identity in matching_services:
                     try:
-                        # Get operations for this service
-                        operations_response = applicationsignals_client.list_service_operations(
-                            StartTime=datetime.fromtimestamp(unix_start, tz=timezone.utc),
-                            EndTime=datetime.fromtimestamp(unix_end, tz=timezone.utc),
-                            KeyAttributes=service_attrs,
-                            MaxResults=100,
-                        )
+                        operations = operations_by_service[identity]
+                        if isinstance(operations, Exception):
+                            raise operations
 
-                        operations = operations_response.get('ServiceOperations', [])
                         logger.debug(
-                            f"Found {len(operations)} operations for service '{service_name}'"
+                            "Found {} operations for service '{}'", len(operations), service_name
                         )
 
-                        # Filter operations based on operation pattern
-                        for operation in operations:
-                            operation_name = operation.get('Name', '')
-
-                            # Check if operation matches the pattern using wildcard matching
-                            if _matches_wildcard_pattern(
+                        # Keep operations matching the pattern that have the required metric type
+                        service_records = [
+                            (service_name, environment, operation_name, metric_type)
+                            for operation_name, metric_types_cf in operations
+                            if metric_type_cf in metric_types_cf
+                            and _matches_wildcard_pattern(
                                 operation_name, compiled_operation_pattern
-                            ):
-                                # Check if this operation has the required metric type
-                                metric_refs = operation.get('MetricReferences', [])
-                                has_metric_type = any(
-                                    ref.get('MetricType', '').casefold() == metric_type.casefold()
-                                    or (
-                                        metric_type.casefold() == 'Availability'.casefold()
-                                        and ref.get('MetricType', '') == 'FAULT'
-                                    )
-                                    for ref in metric_refs
-                                )
-
-                                if has_metric_type:
-                                    service_target = _create_service_target(
-                                        service_name, environment
-                                    )
-                                    expanded_targets.append(
-                                        {
-                                            'Type': 'service_operation',
-                                            'Data': {
-                                                'ServiceOperation': {
-                                                    'Service': service_target['Data']['Service'],
-                                                    'Operation': operation_name,
-                                                    'MetricType': metric_type,
-                                                }
-                                            },
-                                        }
-                                    )
-                                    matches_found += 1
-                                    logger.debug(
-                                        f'Added operation: {service_name} -> {operation_name} ({metric_type})'
-                                    )
-                                else:
-                                    logger.debug(
-                                        f'Skipping operation {operation_name} - no {metric_type} metric available'
-                                    )
+                            )
+                        ]
+                        operation_records.extend(service_records)
+                        matches_found += len(service_records)
+                        logger.debug(
+                            "Added {} operations with {} metrics for service '{}'",
+                            len(service_records),
+                            metric_type,
+                            service_name,
+                        )
 
                     except Exception as e:
                         logger.warning(
-                            f"Failed to get operations for service '{service_name}': {e}"
+                            "Failed to get operations for service '{}': {}", service_name, e
                         )
                         continue
 
                 logger.debug(
-                    f"Service operation pattern '{service_pattern}' + '{operation_pattern}' expanded to {matches_found} targets"
+                    "Service operation pattern '{}' + '{}' expanded to {} targets",
+                    service_pattern,
+                    operation_pattern,
+                    matches_found,
                 )
 
+            expanded_targets.extend(
+                [_create_service_operation_target(*record) for record in operation_records]
+            )
+
             return (
                 expanded_targets,
                 returned_next_token,
@@ -885,9 +1128,16 @@ def expand_service_operation_wildcard_patterns(
     return expanded_targets, None, all_service_names, filtering_stats
 
 
+# Shared compiled form of empty or all-'*' patterns; matching against it short-circuits
+_MATCH_ALL_PATTERN = re.compile('^.*$', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
 def _compile_wildcard_pattern(pattern: Optional[str]) -> Optional[re.Pattern]:
     """Compile wildcard pattern once for reuse.
 
+    Results are memoized, so a pattern repeated across tool calls is only translated once.
+
     Args:
         pattern: Wildcard pattern with * for any characters
 
@@ -902,7 +1152,7 @@ def _compile_wildcard_pattern(pattern: Optional[str]) -> Optional[re.Pattern]:
     # Handle patterns that are empty or only contain wildcards (match everything)
     if pattern is None or pattern.strip('*') == '':
         # Empty or all-wildcard patterns match everything, including empty strings
-        return re.compile('^.*$', re.IGNORECASE)
+        return _MATCH_ALL_PATTERN
 
     # Escape special regex characters except *
     escaped = re.escape(pattern)
@@ -935,6 +1185,10 @@ def _matches_wildcard_pattern(text: Optional[str], compiled_pattern: Optional[re
     if not compiled_pattern:
         return False
 
+    # '*' matches every name; skip the regex engine for the common match-all case
+    if compiled_pattern is _MATCH_ALL_PATTERN:
+        return True
+
     # Handle case where text is None by treating it as empty string
     if text is None:
         text = ''
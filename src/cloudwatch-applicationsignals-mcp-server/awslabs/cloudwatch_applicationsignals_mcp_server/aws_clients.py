@@ -14,107 +14,238 @@
 
 """CloudWatch Application Signals MCP Server - AWS client initialization."""
 
-import boto3
+import asyncio
 import os
+import threading
 from . import __version__
-from botocore.config import Config
+from .utils import get_bool_env, get_positive_int_env
 from loguru import logger
+from typing import Any, Dict, Optional
 
 
-# Get AWS region from environment variable or use default
-AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
-logger.debug(f'Using AWS region: {AWS_REGION}')
+# Get AWS region from environment variable or use default, stripped once for every consumer
+AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1').strip()
+logger.debug('Using AWS region: {}', AWS_REGION)
+
+# Base user agent for every client; MCP_RUN_FROM may append a caller suffix at init
+_USER_AGENT_EXTRA = f'awslabs.cloudwatch-applicationsignals-mcp-server/{__version__}'
+
+# boto3 service name -> (log label, endpoint override env var) for overridable services
+_ENDPOINT_ENV_VARS = {
+    'application-signals': ('Application Signals', 'MCP_APPLICATIONSIGNALS_ENDPOINT'),
+    'logs': ('CloudWatch Logs', 'MCP_LOGS_ENDPOINT'),
+    'cloudwatch': ('CloudWatch', 'MCP_CLOUDWATCH_ENDPOINT'),
+    'xray': ('X-Ray', 'MCP_XRAY_ENDPOINT'),
+    'synthetics': ('Synthetics', 'MCP_SYNTHETICS_ENDPOINT'),
+}
+
+# boto3 service names in the order _initialize_aws_clients returns the clients
+_SERVICE_NAMES = (
+    'logs',
+    'application-signals',
+    'cloudwatch',
+    'xray',
+    'synthetics',
+    's3',
+    'iam',
+    'lambda',
+    'sts',
+)
 
 
 def _initialize_aws_clients():
     """Initialize AWS clients with proper configuration."""
+    # Imported here so loading this module does not pay boto3's import cost. boto3 stays the
+    # only transport: the tools rely on its credential chain, retries and pagination, which a
+    # hand-rolled SigV4 client would have to reimplement for every API called here.
+    import boto3
+    from botocore.config import Config
+
+    # Read each setting once from a single environment lookup
+    env = os.environ
+
     # Add caller suffix if MCP_RUN_FROM is set
-    mcp_source = os.environ.get('MCP_RUN_FROM')
+    mcp_source = env.get('MCP_RUN_FROM')
     user_agent_suffix = f'/{mcp_source}' if mcp_source else ''
 
+    # Allow enough pooled keep-alive connections for overlapping tool calls, audit batches and
+    # operation lookups, fail fast on unreachable endpoints, and retry throttling with standard
+    # backoff.
     config = Config(
-        user_agent_extra=f'awslabs.cloudwatch-applicationsignals-mcp-server/{__version__}{user_agent_suffix}'
+        user_agent_extra=f'{_USER_AGENT_EXTRA}{user_agent_suffix}',
+        max_pool_connections=get_positive_int_env('MCP_AWS_POOL_SIZE', 50),
+        tcp_keepalive=True,
+        connect_timeout=3,
+        retries={'mode': 'standard', 'max_attempts': 3},
     )
 
-    # Get endpoint URLs from environment variables
-    applicationsignals_endpoint = os.environ.get('MCP_APPLICATIONSIGNALS_ENDPOINT')
-    logs_endpoint = os.environ.get('MCP_LOGS_ENDPOINT')
-    cloudwatch_endpoint = os.environ.get('MCP_CLOUDWATCH_ENDPOINT')
-    xray_endpoint = os.environ.get('MCP_XRAY_ENDPOINT')
-    synthetics_endpoint = os.environ.get('MCP_SYNTHETICS_ENDPOINT')
-
-    # Log endpoint overrides
-    if applicationsignals_endpoint:
-        logger.debug(f'Using Application Signals endpoint override: {applicationsignals_endpoint}')
-    if logs_endpoint:
-        logger.debug(f'Using CloudWatch Logs endpoint override: {logs_endpoint}')
-    if cloudwatch_endpoint:
-        logger.debug(f'Using CloudWatch endpoint override: {cloudwatch_endpoint}')
-    if xray_endpoint:
-        logger.debug(f'Using X-Ray endpoint override: {xray_endpoint}')
-    if synthetics_endpoint:
-        logger.debug(f'Using Synthetics endpoint override: {synthetics_endpoint}')
-
-    # Check for AWS_PROFILE environment variable
-    if aws_profile := os.environ.get('AWS_PROFILE'):
-        logger.debug(f'Using AWS profile: {aws_profile}')
-        session = boto3.Session(profile_name=aws_profile, region_name=AWS_REGION)
-        logs = session.client('logs', config=config, endpoint_url=logs_endpoint)
-        applicationsignals = session.client(
-            'application-signals',
-            region_name=AWS_REGION,
-            config=config,
-            endpoint_url=applicationsignals_endpoint,
-        )
-        cloudwatch = session.client('cloudwatch', config=config, endpoint_url=cloudwatch_endpoint)
-        xray = session.client('xray', config=config, endpoint_url=xray_endpoint)
-        synthetics = session.client('synthetics', config=config, endpoint_url=synthetics_endpoint)
-        s3 = session.client('s3', config=config)
-        iam = session.client('iam', config=config)
-        lambda_client = session.client('lambda', config=config)
-        sts = session.client('sts', config=config)
-    else:
-        logs = boto3.client(
-            'logs', region_name=AWS_REGION, config=config, endpoint_url=logs_endpoint
-        )
-        applicationsignals = boto3.client(
-            'application-signals',
-            region_name=AWS_REGION,
-            config=config,
-            endpoint_url=applicationsignals_endpoint,
-        )
-        cloudwatch = boto3.client(
-            'cloudwatch', region_name=AWS_REGION, config=config, endpoint_url=cloudwatch_endpoint
-        )
-        xray = boto3.client(
-            'xray', region_name=AWS_REGION, config=config, endpoint_url=xray_endpoint
-        )
-        # Additional clients for canary functionality
-        synthetics = boto3.client(
-            'synthetics', region_name=AWS_REGION, config=config, endpoint_url=synthetics_endpoint
-        )
-        s3 = boto3.client('s3', region_name=AWS_REGION, config=config)
-        iam = boto3.client('iam', region_name=AWS_REGION, config=config)
-        lambda_client = boto3.client('lambda', region_name=AWS_REGION, config=config)
-        sts = boto3.client('sts', region_name=AWS_REGION, config=config)
+    # Resolve endpoint overrides from environment variables once
+    endpoints = {}
+    for service, (service_label, env_var) in _ENDPOINT_ENV_VARS.items():
+        endpoint = env.get(env_var)
+        if endpoint:
+            logger.debug('Using {} endpoint override: {}', service_label, endpoint)
+        endpoints[service] = endpoint
+
+    # Clients are built serially on purpose: boto3 sessions (including the default session
+    # behind boto3.client) are not thread-safe, so concurrent create_client calls on one
+    # session can race. Lazy initialization keeps this cost off import and unused sessions.
+
+    # One explicit session for every client, with or without AWS_PROFILE, so the
+    # credential chain and endpoint data are resolved once instead of per client.
+    # The session's botocore loader caches parsed endpoint and service model data in
+    # memory, so later clients reuse it. That data is deliberately not persisted to
+    # disk: unpickling from a shared temp directory would execute untrusted content.
+    aws_profile = env.get('AWS_PROFILE')
+    if aws_profile:
+        logger.debug('Using AWS profile: {}', aws_profile)
+    session = boto3.Session(profile_name=aws_profile, region_name=AWS_REGION)
+    session.get_credentials()
+
+    clients = tuple(
+        session.client(service, config=config, endpoint_url=endpoints.get(service))
+        for service in _SERVICE_NAMES
+    )
 
     logger.debug('AWS clients initialized successfully')
-    return logs, applicationsignals, cloudwatch, xray, synthetics, s3, iam, lambda_client, sts
-
-
-# Initialize clients at module level
-try:
-    (
-        logs_client,
-        applicationsignals_client,
-        cloudwatch_client,
-        xray_client,
-        synthetics_client,
-        s3_client,
-        iam_client,
-        lambda_client,
-        sts_client,
-    ) = _initialize_aws_clients()
-except Exception as e:
-    logger.error(f'Failed to initialize AWS clients: {str(e)}')
-    raise
+    return clients
+
+
+# Module attribute names of the clients, in the order _initialize_aws_clients returns them
+_CLIENT_NAMES = (
+    'logs_client',
+    'applicationsignals_client',
+    'cloudwatch_client',
+    'xray_client',
+    'synthetics_client',
+    's3_client',
+    'iam_client',
+    'lambda_client',
+    'sts_client',
+)
+
+_clients_singleton: Optional[Dict[str, Any]] = None
+_clients_lock = threading.Lock()
+
+
+def _prewarm_connections(clients: Dict[str, Any]) -> threading.Thread:
+    """Open connections to the most used endpoints in the background with cheap read calls.
+
+    Errors (including missing permissions) are ignored; the calls only exist to complete the
+    TCP/TLS handshakes before the first real tool invocation.
+    """
+    warm_calls = (
+        lambda: clients['applicationsignals_client'].list_service_level_objectives(MaxResults=1),
+        lambda: clients['cloudwatch_client'].describe_alarms(MaxRecords=1),
+        lambda: clients['logs_client'].describe_log_groups(limit=1),
+    )
+
+    def _warm() -> None:
+        for call in warm_calls:
+            try:
+                call()
+            except Exception as e:
+                logger.debug('Connection pre-warm call failed: {}', e)
+
+    thread = threading.Thread(target=_warm, name='aws-client-prewarm', daemon=True)
+    thread.start()
+    return thread
+
+
+def _get_clients() -> Dict[str, Any]:
+    """Initialize all AWS clients on first use and return them by attribute name.
+
+    A failed initialization is not cached: the error propagates to the caller and the next
+    client access tries again, so a transient credentials outage does not require a restart.
+    """
+    global _clients_singleton
+    # Double-checked locking: tool calls running in worker threads must not build the
+    # clients twice, while the common already-initialized path stays lock-free
+    if _clients_singleton is None:
+        with _clients_lock:
+            if _clients_singleton is None:
+                try:
+                    clients = dict(zip(_CLIENT_NAMES, _initialize_aws_clients()))
+                except Exception as e:
+                    logger.error(f'Failed to initialize AWS clients: {str(e)}')
+                    raise
+                if get_bool_env('MCP_AWS_PREWARM'):
+                    _prewarm_connections(clients)
+                _clients_singleton = clients
+    return _clients_singleton
+
+
+def initialize_clients_in_background() -> threading.Thread:
+    """Start building the AWS clients on a daemon thread.
+
+    Called at server startup so the boto3 import, session creation and credential lookup
+    (which may mean SSO, IMDS or STS round trips) happen before the first tool call and never
+    on the event loop. A failure is logged by _get_clients and retried on the next client use.
+    """
+
+    def _initialize() -> None:
+        try:
+            _get_clients()
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=_initialize, name='aws-client-init', daemon=True)
+    thread.start()
+    return thread
+
+
+async def call_in_thread(client: Any, method: str, **kwargs: Any) -> Any:
+    """Call a client method in a worker thread.
+
+    The method is looked up inside the worker as well, so if the clients are not built yet
+    their initialization also stays off the event loop.
+    """
+    return await asyncio.to_thread(lambda: getattr(client, method)(**kwargs))
+
+
+def _reset_clients() -> None:
+    """Drop the cached clients so the next client call initializes them again.
+
+    Every module-level client is a _LazyClient that resolves through the singleton on each
+    attribute access, so all importers see the new clients. Credential rotation does not need
+    a reset because botocore refreshes assumed-role, SSO and instance credentials on its own.
+    """
+    global _clients_singleton
+    with _clients_lock:
+        _clients_singleton = None
+
+
+class _LazyClient:
+    """Stand-in for one AWS client that initializes the clients on first attribute access.
+
+    Tool modules bind clients by name at import time (``from .aws_clients import
+    logs_client``), so the names must exist without building anything. Attribute access
+    (``logs_client.filter_log_events``) is forwarded to the real client, which is created
+    together with the others the first time any client is used.
+    """
+
+    __slots__ = ('_name',)
+
+    def __init__(self, name: str):
+        """Remember which client this stand-in resolves to."""
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        """Forward attribute access to the initialized client."""
+        return getattr(_get_clients()[self._name], attr)
+
+    def __repr__(self) -> str:
+        """Name the client without initializing it."""
+        return f'<lazy AWS client {self._name}>'
+
+
+# Clients are typed as Any: callers use them exactly like the boto3 clients they stand for
+logs_client: Any = _LazyClient('logs_client')
+applicationsignals_client: Any = _LazyClient('applicationsignals_client')
+cloudwatch_client: Any = _LazyClient('cloudwatch_client')
+xray_client: Any = _LazyClient('xray_client')
+synthetics_client: Any = _LazyClient('synthetics_client')
+s3_client: Any = _LazyClient('s3_client')
+iam_client: Any = _LazyClient('iam_client')
+lambda_client: Any = _LazyClient('lambda_client')
+sts_client: Any = _LazyClient('sts_client')
@@ -15,6 +15,7 @@
 """Utility functions for CloudWatch Synthetics canary analysis and debugging."""
 
 import asyncio
+import fnmatch
 import gzip
 import json
 import os
@@ -196,10 +197,12 @@ async def analyze_har_file(s3_client, bucket_name, har_files, is_failed_run=True
         if har_key.endswith('.gz'):
             har_content = gzip.decompress(har_content)
 
-        content_str = har_content.decode('utf-8')
+        # Plain HAR JSON is parsed from bytes directly; only the HTML wrapper needs decoding
+        har_json = har_content
 
         # Handle .har.html format
         if har_key.endswith('.har.html'):
+            content_str = har_content.decode('utf-8')
             # Extract JSON from HTML wrapper - find matching braces
             start_match = re.search(r'var harOutput\s*=\s*({)', content_str)
             if start_match:
@@ -218,7 +221,7 @@ async def analyze_har_file(s3_client, bucket_name, har_files, is_failed_run=True
                             break
 
                 if json_end > 0:
-                    content_str = content_str[json_start:json_end]
+                    har_json = content_str[json_start:json_end]
                 else:
                     return {'status': 'error', 'insights': ['Could not find end of HAR JSON data']}
             else:
@@ -227,7 +230,7 @@ async def analyze_har_file(s3_client, bucket_name, har_files, is_failed_run=True
                     'insights': ['Could not find harOutput variable in HTML'],
                 }
 
-        har_data = json.loads(content_str)
+        har_data = json.loads(har_json)
 
         entries = har_data.get('log', {}).get('entries', [])
         if not entries:
@@ -564,8 +567,8 @@ def _matches_bucket_pattern(actual_bucket: str, pattern: str) -> bool:
         return True
 
     if '*' in pattern:
-        regex_pattern = pattern.replace('*', '.*')
-        return bool(re.match(f'^{regex_pattern}$', actual_bucket))
+        # fnmatch escapes literal characters such as '.' and caches the translated regex
+        return fnmatch.fnmatchcase(actual_bucket, pattern)
 
     return False
 
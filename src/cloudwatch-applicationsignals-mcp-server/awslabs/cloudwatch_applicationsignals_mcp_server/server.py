@@ -14,6 +14,7 @@
 
 """CloudWatch Application Signals MCP Server - Core server implementation."""
 
+import asyncio
 import json
 import os
 import re
@@ -21,6 +22,7 @@ import sys
 import tempfile
 from .audit_presentation_utils import format_pagination_info
 from .audit_utils import (
+    dedupe_audit_targets,
     execute_audit_api,
     expand_service_operation_wildcard_patterns,
     expand_service_wildcard_patterns,
@@ -30,7 +32,9 @@ from .audit_utils import (
 from .aws_clients import (
     AWS_REGION,
     applicationsignals_client,
+    call_in_thread,
     iam_client,
+    initialize_clients_in_background,
     s3_client,
     synthetics_client,
 )
@@ -106,13 +110,13 @@ logger.add(
     rotation='10 MB',  # Rotate when file reaches 10MB
     retention='7 days',  # Keep logs for 7 days
     format='{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}',
-    enqueue=True,  # Thread-safe logging
+    # Writes, rotation and retention run on loguru's worker thread, off the event loop;
+    # audit responses logged here can be several MB
+    enqueue=True,
 )
 
-logger.debug(f'CloudWatch applicationsignals MCP Server initialized with log level: {log_level}')
-logger.debug(f'File logging enabled: {aws_cli_log_path}')
-
-logger.debug(f'Using AWS region: {AWS_REGION}')
+logger.debug('CloudWatch applicationsignals MCP Server initialized with log level: {}', log_level)
+logger.debug('File logging enabled: {}', aws_cli_log_path)
 
 
 def _filter_operation_targets(provided):
@@ -123,21 +127,39 @@ def _filter_operation_targets(provided):
 
     Returns:
         tuple: (operation_only_targets, has_wildcards)
+
+    Raises:
+        ValueError: If a service_operation target lacks its Service object or operation, so
+            malformed input is rejected before any wildcard expansion or API call
     """
     operation_only_targets = []
     has_wildcards = False
 
-    for target in provided:
+    for idx, target in enumerate(provided, 1):
         if isinstance(target, dict):
             ttype = target.get('Type', '').lower()
             if ttype == 'service_operation':
-                # Check for wildcard patterns in service names OR operation names
-                service_op_data = target.get('Data', {}).get('ServiceOperation', {})
-                service_data = service_op_data.get('Service', {})
-                service_name = service_data.get('Name', '')
-                operation = service_op_data.get('Operation', '')
+                data = target.get('Data')
+                service_op_data = data.get('ServiceOperation') if isinstance(data, dict) else None
+                if not isinstance(service_op_data, dict):
+                    raise ValueError(
+                        f'operation_targets[{idx}]: Data.ServiceOperation must be an object'
+                    )
+                service_data = service_op_data.get('Service')
+                operation = service_op_data.get('Operation')
+                if not isinstance(service_data, dict):
+                    raise ValueError(
+                        f'operation_targets[{idx}]: Data.ServiceOperation.Service must be an object'
+                    )
+                if not operation or not isinstance(operation, str):
+                    raise ValueError(
+                        f'operation_targets[{idx}]: Data.ServiceOperation.Operation is required'
+                    )
 
-                if '*' in service_name or '*' in operation:
+                # Check for wildcard patterns in service names OR operation names; services
+                # identified by other KeyAttributes may have no Name
+                service_name = service_data.get('Name')
+                if (isinstance(service_name, str) and '*' in service_name) or '*' in operation:
                     has_wildcards = True
 
                 # For fault metrics, ListAuditFindings uses Availability metric type.
@@ -328,17 +350,12 @@ async def audit_services(
 
     try:
         # Region defaults
-        region = AWS_REGION.strip()
+        region = AWS_REGION
 
-        # Time range (fill missing with defaults)
-        start_dt = (
-            parse_timestamp(start_time)
-            if start_time
-            else (datetime.now(timezone.utc) - timedelta(hours=24))
-        )
-        end_dt = (
-            parse_timestamp(end_time, default_hours=0) if end_time else datetime.now(timezone.utc)
-        )
+        # Time range (fill missing with defaults from a single clock read)
+        now = datetime.now(timezone.utc)
+        start_dt = parse_timestamp(start_time) if start_time else (now - timedelta(hours=24))
+        end_dt = parse_timestamp(end_time, default_hours=0) if end_time else now
         unix_start, unix_end = int(start_dt.timestamp()), int(end_dt.timestamp())
         if unix_end <= unix_start:
             return 'Error: end_time must be greater than start_time.'
@@ -349,11 +366,12 @@ async def audit_services(
         except json.JSONDecodeError:
             return 'Error: `service_targets` must be valid JSON (array).'
 
-        # Check for wildcard patterns in service names
+        # Check for wildcard patterns in service names (debug args are formatted lazily, so
+        # targets are only rendered when debug logging is enabled)
         has_wildcards = False
-        logger.debug(f'audit_services: Checking {len(provided)} targets for wildcards')
+        logger.debug('audit_services: Checking {} targets for wildcards', len(provided))
         for i, target in enumerate(provided):
-            logger.debug(f'audit_services: Target {i}: {target}')
+            logger.debug('audit_services: Target {}: {}', i, target)
             if isinstance(target, dict):
                 # Check various possible service name locations
                 service_name = None
@@ -369,15 +387,15 @@ async def audit_services(
                     if not service_name:
                         service_name = target.get('Service', '')
 
-                logger.debug(f"audit_services: Target {i} service name: '{service_name}'")
+                logger.debug("audit_services: Target {} service name: '{}'", i, service_name)
                 if service_name and isinstance(service_name, str) and '*' in service_name:
                     logger.debug(
-                        f"audit_services: Target {i} has wildcard pattern: '{service_name}'"
+                        "audit_services: Target {} has wildcard pattern: '{}'", i, service_name
                     )
                     has_wildcards = True
                     break
 
-        logger.debug(f'audit_services: has_wildcards = {has_wildcards}')
+        logger.debug('audit_services: has_wildcards = {}', has_wildcards)
 
         # Expand wildcard patterns using paginated utility when wildcards are present
         service_names_in_batch = []
@@ -386,15 +404,20 @@ async def audit_services(
 
         if has_wildcards:
             logger.debug('Wildcard patterns detected - applying paginated service expansion')
-            (provided, returned_next_token, service_names_in_batch, filtering_stats) = (
-                expand_service_wildcard_patterns(
-                    provided,
-                    unix_start,
-                    unix_end,
-                    next_token,
-                    max_services,
-                    applicationsignals_client,
-                )
+            # Expansion issues blocking boto3 calls; run it off the event loop
+            (
+                provided,
+                returned_next_token,
+                service_names_in_batch,
+                filtering_stats,
+            ) = await asyncio.to_thread(
+                expand_service_wildcard_patterns,
+                provided,
+                unix_start,
+                unix_end,
+                next_token,
+                max_services,
+                applicationsignals_client,
             )
             logger.debug(f'Paginated wildcard expansion completed - {len(provided)} total targets')
 
@@ -410,9 +433,14 @@ async def audit_services(
         normalized_targets = normalize_service_targets(provided)
 
         # Validate and enrich targets using shared utility
-        normalized_targets = validate_and_enrich_service_targets(
-            normalized_targets, applicationsignals_client, unix_start, unix_end
+        normalized_targets = await asyncio.to_thread(
+            validate_and_enrich_service_targets,
+            normalized_targets,
+            applicationsignals_client,
+            unix_start,
+            unix_end,
         )
+        normalized_targets = dedupe_audit_targets(normalized_targets)
 
         # Parse auditors with service-specific defaults
         auditors_list = parse_auditors(auditors, ['slo', 'operation_metric'])
@@ -433,7 +461,7 @@ async def audit_services(
 
         banner += '\n'
 
-        # Build CLI input
+        # Build audit API input
         input_obj = {
             'StartTime': unix_start,
             'EndTime': unix_end,
@@ -596,17 +624,12 @@ async def audit_slos(
 
     try:
         # Region defaults
-        region = AWS_REGION.strip()
+        region = AWS_REGION
 
-        # Time range (fill missing with defaults)
-        start_dt = (
-            parse_timestamp(start_time)
-            if start_time
-            else (datetime.now(timezone.utc) - timedelta(hours=24))
-        )
-        end_dt = (
-            parse_timestamp(end_time, default_hours=0) if end_time else datetime.now(timezone.utc)
-        )
+        # Time range (fill missing with defaults from a single clock read)
+        now = datetime.now(timezone.utc)
+        start_dt = parse_timestamp(start_time) if start_time else (now - timedelta(hours=24))
+        end_dt = parse_timestamp(end_time, default_hours=0) if end_time else now
         unix_start, unix_end = int(start_dt.timestamp()), int(end_dt.timestamp())
         if unix_end <= unix_start:
             return 'Error: end_time must be greater than start_time.'
@@ -650,10 +673,16 @@ async def audit_slos(
             logger.debug(f'Expanding {len(wildcard_patterns)} SLO wildcard patterns')
             try:
                 # Use the paginated utility function
-                expanded_slo_targets, returned_next_token, slo_names_in_batch = (
-                    expand_slo_wildcard_patterns(
-                        provided, next_token, max_slos, applicationsignals_client
-                    )
+                (
+                    expanded_slo_targets,
+                    returned_next_token,
+                    slo_names_in_batch,
+                ) = await asyncio.to_thread(
+                    expand_slo_wildcard_patterns,
+                    provided,
+                    next_token,
+                    max_slos,
+                    applicationsignals_client,
                 )
                 # Filter to get only SLO targets
                 slo_only_targets = [
@@ -672,6 +701,7 @@ async def audit_slos(
 
         if not slo_only_targets:
             return 'Error: No SLO targets found after wildcard expansion.'
+        slo_only_targets = dedupe_audit_targets(slo_only_targets)
 
         # Parse auditors with SLO-specific defaults
         auditors_list = parse_auditors(auditors, ['slo'])  # Default to SLO auditor
@@ -687,7 +717,7 @@ async def audit_slos(
 
         banner += '\n'
 
-        # Build CLI input for SLO audit
+        # Build audit API input for SLO audit
         input_obj = {
             'StartTime': unix_start,
             'EndTime': unix_end,
@@ -861,17 +891,12 @@ async def audit_service_operations(
 
     try:
         # Region defaults
-        region = AWS_REGION.strip()
+        region = AWS_REGION
 
-        # Time range (fill missing with defaults)
-        start_dt = (
-            parse_timestamp(start_time)
-            if start_time
-            else (datetime.now(timezone.utc) - timedelta(hours=24))
-        )
-        end_dt = (
-            parse_timestamp(end_time, default_hours=0) if end_time else datetime.now(timezone.utc)
-        )
+        # Time range (fill missing with defaults from a single clock read)
+        now = datetime.now(timezone.utc)
+        start_dt = parse_timestamp(start_time) if start_time else (now - timedelta(hours=24))
+        end_dt = parse_timestamp(end_time, default_hours=0) if end_time else now
         unix_start, unix_end = int(start_dt.timestamp()), int(end_dt.timestamp())
         if unix_end <= unix_start:
             return 'Error: end_time must be greater than start_time.'
@@ -888,7 +913,10 @@ async def audit_service_operations(
             return 'Error: `operation_targets` must contain at least 1 item'
 
         # Filter operation targets and check for wildcards using helper function
-        operation_only_targets, has_wildcards = _filter_operation_targets(provided)
+        try:
+            operation_only_targets, has_wildcards = _filter_operation_targets(provided)
+        except ValueError as e:
+            return f'Error: {e}'
 
         # Expand wildcard patterns using shared utility with pagination support
         service_names_in_batch = []
@@ -904,7 +932,8 @@ async def audit_service_operations(
                 returned_next_token,
                 service_names_in_batch,
                 filtering_stats,
-            ) = expand_service_operation_wildcard_patterns(
+            ) = await asyncio.to_thread(
+                expand_service_operation_wildcard_patterns,
                 operation_only_targets,
                 unix_start,
                 unix_end,
@@ -922,6 +951,7 @@ async def audit_service_operations(
 
         if not operation_only_targets:
             return 'Error: No service_operation targets found after wildcard expansion. Use list_monitored_services() to see available services.'
+        operation_only_targets = dedupe_audit_targets(operation_only_targets)
 
         # Parse auditors with operation-specific defaults
         auditors_list = parse_auditors(
@@ -943,7 +973,7 @@ async def audit_service_operations(
 
         banner += '\n'
 
-        # Build CLI input for operation audit
+        # Build audit API input for operation audit
         input_obj = {
             'StartTime': unix_start,
             'EndTime': unix_end,
@@ -1024,12 +1054,12 @@ async def analyze_canary_failures(canary_name: str, region: str = AWS_REGION) ->
             - Historical pattern analysis and trend insights
     """
     try:
-        # Get recent canary runs
-        response = synthetics_client.get_canary_runs(Name=canary_name, MaxResults=5)
+        # Get recent canary runs and canary details concurrently, off the event loop
+        response, canary_response = await asyncio.gather(
+            call_in_thread(synthetics_client, 'get_canary_runs', Name=canary_name, MaxResults=5),
+            call_in_thread(synthetics_client, 'get_canary', Name=canary_name),
+        )
         runs = response.get('CanaryRuns', [])
-
-        # Get canary details
-        canary_response = synthetics_client.get_canary(Name=canary_name)
         canary = canary_response['Canary']
 
         # Get telemetry and service insights
@@ -1131,8 +1161,6 @@ async def analyze_canary_failures(canary_name: str, region: str = AWS_REGION) ->
                     base_path = f'canary/{region}/{canary_name}'
 
                 # Check for failure artifacts using date-based path
-                from datetime import datetime
-
                 failure_time = selected_failure.get('Timeline', {}).get('Started')
                 if failure_time:
                     # Handle both datetime objects and string timestamps
@@ -1150,8 +1178,12 @@ async def analyze_canary_failures(canary_name: str, region: str = AWS_REGION) ->
                     failure_run_path = f'{base_path}/{today}/' if base_path else f'{today}/'
 
                 try:
-                    artifacts_response = s3_client.list_objects_v2(
-                        Bucket=bucket_name, Prefix=failure_run_path, MaxKeys=50
+                    artifacts_response = await call_in_thread(
+                        s3_client,
+                        'list_objects_v2',
+                        Bucket=bucket_name,
+                        Prefix=failure_run_path,
+                        MaxKeys=50,
                     )
                     failure_artifacts = artifacts_response.get('Contents', [])
 
@@ -1197,8 +1229,12 @@ async def analyze_canary_failures(canary_name: str, region: str = AWS_REGION) ->
                             else:
                                 success_run_path = failure_run_path  # Use same path as fallback
                             try:
-                                success_artifacts_response = s3_client.list_objects_v2(
-                                    Bucket=bucket_name, Prefix=success_run_path, MaxKeys=50
+                                success_artifacts_response = await call_in_thread(
+                                    s3_client,
+                                    'list_objects_v2',
+                                    Bucket=bucket_name,
+                                    Prefix=success_run_path,
+                                    MaxKeys=50,
                                 )
                                 success_artifacts = success_artifacts_response.get('Contents', [])
                                 success_har_files = [
@@ -1507,6 +1543,9 @@ mcp.tool()(list_grouping_attribute_definitions)
 def main():
     """Run the MCP server."""
     logger.debug('Starting CloudWatch Application Signals MCP server')
+    # Build the AWS clients off the event loop while the MCP session is being set up; with
+    # MCP_AWS_PREWARM enabled this also opens the first connections before any tool call
+    initialize_clients_in_background()
     try:
         mcp.run(transport='stdio')
     except KeyboardInterrupt:
@@ -14,6 +14,7 @@
 
 """Service-specific utilities for service audit tool."""
 
+from .utils import list_services_paginated, ttl_cached
 from datetime import datetime, timezone
 from loguru import logger
 from typing import Any, List, Optional
@@ -24,10 +25,12 @@ def _ci_get(d: dict, *names) -> Optional[Any]:
     for n in names:
         if n in d:
             return d[n]
-    lower = {k.lower(): v for k, v in d.items()}
-    for n in names:
-        if n.lower() in lower:
-            return lower[n.lower()]
+    # Only keep keys that can match; most misses are optional fields that are simply absent
+    wanted = [n.lower() for n in names]
+    lower = {lk: v for k, v in d.items() if (lk := k.lower()) in wanted}
+    for n in wanted:
+        if n in lower:
+            return lower[n]
     return None
 
 
@@ -57,18 +60,16 @@ def coerce_service_target(t: dict) -> dict:
     data = _ci_get(t, 'Data', 'data') or {}
     service = _ci_get(data, 'Service', 'service') or _ci_get(t, 'Service', 'service')
 
+    # The entity is only read below, so a dict payload is used as-is rather than copied
     if isinstance(service, str):
         entity = {'Name': service}
     elif isinstance(service, dict):
-        entity = dict(service)
+        entity = service
     elif isinstance(data, dict) and _ci_get(data, 'Name', 'name'):
         entity = {'Name': _ci_get(data, 'Name', 'name')}
     else:
         raise ValueError("service target missing 'Service' payload")
 
-    if 'Type' not in entity and 'type' not in entity:
-        entity['Type'] = 'Service'
-
     name = _ci_get(entity, 'Name', 'name')
     env = _ci_get(entity, 'Environment', 'environment')
     acct = _ci_get(entity, 'AwsAccountId', 'awsAccountId', 'aws_account_id')
@@ -144,6 +145,7 @@ def validate_and_enrich_service_targets(
     Wildcard patterns should be expanded before calling this function.
     """
     enriched_targets = []
+    services_by_name = None
 
     for idx, t in enumerate(normalized_targets, 1):
         target_type = (t.get('Type') or '').lower()
@@ -164,20 +166,31 @@ def validate_and_enrich_service_targets(
                 # Fetch service details from API to get environment
                 logger.debug(f'Fetching environment for service: {service_name}')
                 try:
-                    # Get all services to find the one we want
-                    services_response = applicationsignals_client.list_services(
-                        StartTime=datetime.fromtimestamp(unix_start, tz=timezone.utc),
-                        EndTime=datetime.fromtimestamp(unix_end, tz=timezone.utc),
-                        MaxResults=100,
-                    )
+                    # Get all services (every page, so services beyond the first 100 are
+                    # found) once per call, shared through the API cache across calls, and
+                    # index them by name; the first listed service wins, as in a linear scan
+                    if services_by_name is None:
+                        service_summaries = ttl_cached(
+                            (
+                                'list_services_paginated',
+                                applicationsignals_client,
+                                unix_start // 60,
+                                unix_end // 60,
+                            ),
+                            lambda: list_services_paginated(
+                                applicationsignals_client,
+                                datetime.fromtimestamp(unix_start, tz=timezone.utc),
+                                datetime.fromtimestamp(unix_end, tz=timezone.utc),
+                            ),
+                        )
+                        services_by_name = {}
+                        for service in service_summaries:
+                            services_by_name.setdefault(
+                                service.get('KeyAttributes', {}).get('Name'), service
+                            )
 
                     # Find the service with matching name
-                    target_service = None
-                    for service in services_response.get('ServiceSummaries', []):
-                        key_attrs = service.get('KeyAttributes', {})
-                        if key_attrs.get('Name') == service_name:
-                            target_service = service
-                            break
+                    target_service = services_by_name.get(service_name)
 
                     if target_service:
                         key_attrs = target_service.get('KeyAttributes', {})
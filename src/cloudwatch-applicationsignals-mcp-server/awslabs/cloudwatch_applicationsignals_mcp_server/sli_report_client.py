@@ -202,12 +202,21 @@ class SLIReportClient:
         logger.debug(f'Fetching SLO summaries for {self.config.service_name}')
 
         try:
-            response = self.signals_client.list_service_level_objectives(
-                KeyAttributes=self.config.key_attributes,
-                MetricSourceTypes=['ServiceOperation'],
-                IncludeLinkedAccounts=True,
-            )
-            logger.info(f'Retrieved {len(response.get("SloSummaries", []))} SLO summaries')
+            # Follow NextToken so services with more SLOs than one page are not truncated
+            request_params = {
+                'KeyAttributes': self.config.key_attributes,
+                'MetricSourceTypes': ['ServiceOperation'],
+                'IncludeLinkedAccounts': True,
+            }
+            slo_summaries = []
+            while True:
+                response = self.signals_client.list_service_level_objectives(**request_params)
+                slo_summaries.extend(response['SloSummaries'])
+                next_token = response.get('NextToken')
+                if not next_token:
+                    break
+                request_params['NextToken'] = next_token
+            logger.info(f'Retrieved {len(slo_summaries)} SLO summaries')
         except ClientError as e:
             error_msg = e.response.get('Error', {}).get('Message', 'Unknown error')
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
@@ -225,7 +234,7 @@ class SLIReportClient:
                 operation_name=slo.get('OperationName', 'N/A'),
                 created_time=slo.get('CreatedTime', datetime.now(timezone.utc)),
             )
-            for slo in response['SloSummaries']
+            for slo in slo_summaries
         ]
 
     def create_metric_queries(self, slo_summaries: List[SLOSummary]) -> List[Dict[str, Any]]:
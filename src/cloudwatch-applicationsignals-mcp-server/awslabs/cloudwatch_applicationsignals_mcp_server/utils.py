@@ -14,9 +14,15 @@
 
 """CloudWatch Application Signals MCP Server - Utility functions."""
 
+import functools
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from loguru import logger
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple, TypeVar
 
 
 # =============================================================================
@@ -37,34 +43,138 @@ ERROR_THRESHOLD_CRITICAL = 5.0  # Error rate >= 5% triggers CRITICAL
 LATENCY_P99_THRESHOLD_WARNING = 1000.0  # P99 >= 1000ms (1s) triggers WARNING
 LATENCY_P99_THRESHOLD_CRITICAL = 5000.0  # P99 >= 5000ms (5s) triggers CRITICAL
 
+# =============================================================================
+# Environment Settings
+# =============================================================================
+# Tuning knobs are read from the environment at import; malformed values fall back to
+# their defaults with a warning instead of failing the server.
 
-def remove_null_values(data: dict) -> dict:
-    """Remove keys with None values from a dictionary.
+
+def get_bool_env(name: str) -> bool:
+    """Return True when an environment flag is set to 1, true or yes (case-insensitive)."""
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes')
+
+
+def get_positive_int_env(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment.
 
     Args:
-        data: Dictionary to clean
+        name: Environment variable name
+        default: Value used when the variable is unset or not an integer
 
     Returns:
-        Dictionary with None values removed
+        The configured value, raised to at least 1
     """
-    return {k: v for k, v in data.items() if v is not None}
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning('Ignoring non-integer {}={!r}; using {}', name, raw, default)
+        return default
 
 
-def parse_timestamp(timestamp_str: str, default_hours: int = 24) -> datetime:
-    """Parse timestamp string into datetime object.
+def get_non_negative_float_env(name: str, default: float) -> float:
+    """Read a non-negative number setting from the environment.
 
     Args:
-        timestamp_str: Timestamp in unix seconds or 'YYYY-MM-DD HH:MM:SS' format
-        default_hours: Default hours to subtract from now if parsing fails
+        name: Environment variable name
+        default: Value used when the variable is unset or not a finite number
 
     Returns:
-        datetime object in UTC timezone
+        The configured value, raised to at least 0
     """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
     try:
-        # Ensure we have a string
-        if not isinstance(timestamp_str, str):
-            timestamp_str = str(timestamp_str)
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not math.isfinite(value):
+        logger.warning('Ignoring non-numeric {}={!r}; using {}', name, raw, default)
+        return default
+    return max(0.0, value)
+
 
+# =============================================================================
+# AWS API Response Caching
+# =============================================================================
+# Service and SLO inventories change on the order of minutes, so list calls made
+# by wildcard expansion are cached briefly. Set MCP_APPSIGNALS_CACHE_TTL=0 to disable;
+# negative values are treated as 0 and non-numeric ones fall back to 60 seconds.
+# Keys include minute-bucketed time windows that move with the clock, so the cache is
+# bounded: expired entries are dropped on insert and the least recently used go first.
+
+API_CACHE_TTL_SECONDS = get_non_negative_float_env('MCP_APPSIGNALS_CACHE_TTL', 60.0)
+API_CACHE_MAX_ENTRIES = 64
+
+T = TypeVar('T')
+
+_api_cache: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+_api_cache_lock = threading.Lock()
+
+
+def ttl_cached(key: Hashable, fetch: Callable[[], T]) -> T:
+    """Return a cached result for key, calling fetch when it is missing or expired.
+
+    Args:
+        key: Hashable cache key identifying the API call and its parameters
+        fetch: Zero-argument callable that performs the API call
+
+    Returns:
+        The cached or freshly fetched result. Exceptions from fetch are not cached.
+    """
+    if API_CACHE_TTL_SECONDS <= 0:
+        return fetch()
+
+    now = time.monotonic()
+    with _api_cache_lock:
+        entry = _api_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _api_cache.move_to_end(key)
+            return entry[1]
+
+    value = fetch()
+    with _api_cache_lock:
+        for expired_key in [k for k, (expires, _) in _api_cache.items() if expires <= now]:
+            del _api_cache[expired_key]
+        _api_cache[key] = (now + API_CACHE_TTL_SECONDS, value)
+        _api_cache.move_to_end(key)
+        while len(_api_cache) > API_CACHE_MAX_ENTRIES:
+            _api_cache.popitem(last=False)
+    return value
+
+
+def clear_api_cache() -> None:
+    """Drop all cached AWS API responses."""
+    with _api_cache_lock:
+        _api_cache.clear()
+
+
+def remove_null_values(data: dict) -> dict:
+    """Remove keys with None values from a dictionary.
+
+    Args:
+        data: Dictionary to clean
+
+    Returns:
+        Dictionary with None values removed; the input itself when it has no None values
+    """
+    if not any(v is None for v in data.values()):
+        return data
+    return {k: v for k, v in data.items() if v is not None}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_absolute_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse an absolute timestamp string, returning None when no format matches.
+
+    Results depend only on the input string, so they are memoized; the relative
+    fallback in parse_timestamp depends on the current time and stays uncached.
+    """
+    try:
         # Try parsing as unix timestamp first
         if timestamp_str.isdigit():
             return datetime.fromtimestamp(int(timestamp_str), tz=timezone.utc)
@@ -76,8 +186,82 @@ def parse_timestamp(timestamp_str: str, default_hours: int = 24) -> datetime:
         # Try parsing as 'YYYY-MM-DD HH:MM:SS' format
         return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
     except (ValueError, TypeError):
-        # Fallback to default
-        return datetime.now(timezone.utc) - timedelta(hours=default_hours)
+        return None
+
+
+def parse_timestamp(timestamp_str: str, default_hours: int = 24) -> datetime:
+    """Parse timestamp string into datetime object.
+
+    Args:
+        timestamp_str: Timestamp in unix seconds or 'YYYY-MM-DD HH:MM:SS' format
+        default_hours: Default hours to subtract from now if parsing fails
+
+    Returns:
+        datetime object in UTC timezone
+    """
+    # Ensure we have a string
+    if not isinstance(timestamp_str, str):
+        timestamp_str = str(timestamp_str)
+
+    parsed = _parse_absolute_timestamp(timestamp_str)
+    if parsed is not None:
+        return parsed
+
+    # Fallback to default
+    return datetime.now(timezone.utc) - timedelta(hours=default_hours)
+
+
+# Domain terms that boost fuzzy name similarity when shared by both names
+SLO_KEY_TERMS = (
+    'availability',
+    'latency',
+    'error',
+    'fault',
+    'search',
+    'owner',
+    'response',
+    'time',
+    'success',
+    'failure',
+    'request',
+    'operation',
+)
+SERVICE_KEY_TERMS = (
+    'service',
+    'api',
+    'web',
+    'app',
+    'backend',
+    'frontend',
+    'database',
+    'cache',
+    'queue',
+    'worker',
+    'lambda',
+    'function',
+    'microservice',
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _similarity_features(
+    name: str, name_type: str
+) -> Tuple[str, str, FrozenSet[str], FrozenSet[str]]:
+    """Return the (lowercased, normalized, words, key terms) features of a name.
+
+    Fuzzy matching scores every target against every listed service, so each name's
+    features are memoized instead of being recomputed for every pair.
+    """
+    lower = name.lower().strip()
+    # Normalize for special characters (treat -, _, . as equivalent)
+    normalized = lower.replace('_', '-').replace('.', '-')
+    key_terms = SLO_KEY_TERMS if name_type == 'slo' else SERVICE_KEY_TERMS
+    return (
+        lower,
+        normalized,
+        frozenset(normalized.split()),
+        frozenset(term for term in key_terms if term in normalized),
+    )
 
 
 def calculate_name_similarity(
@@ -93,8 +277,12 @@ def calculate_name_similarity(
     Returns:
         Similarity score (0-100, higher is better match)
     """
-    target_lower = target_name.lower().strip()
-    candidate_lower = candidate_name.lower().strip()
+    target_lower, target_normalized, target_words, target_terms = _similarity_features(
+        target_name, name_type
+    )
+    candidate_lower, candidate_normalized, candidate_words, candidate_terms = _similarity_features(
+        candidate_name, name_type
+    )
 
     # Handle empty strings
     if not target_lower or not candidate_lower:
@@ -104,19 +292,12 @@ def calculate_name_similarity(
     if target_lower == candidate_lower:
         return 100
 
-    # Normalize for special characters (treat -, _, . as equivalent)
-    target_normalized = target_lower.replace('_', '-').replace('.', '-')
-    candidate_normalized = candidate_lower.replace('_', '-').replace('.', '-')
-
     if target_normalized == candidate_normalized:
         return 95
 
     score = 0
 
     # Word-based matching (most important for fuzzy matching)
-    target_words = set(target_normalized.split())
-    candidate_words = set(candidate_normalized.split())
-
     if target_words and candidate_words:
         common_words = target_words.intersection(candidate_words)
         if common_words:
@@ -143,42 +324,7 @@ def calculate_name_similarity(
         score += int(containment_ratio * 25)  # Up to 25 points
 
     # Check for key domain terms that should boost relevance
-    if name_type == 'slo':
-        key_terms = [
-            'availability',
-            'latency',
-            'error',
-            'fault',
-            'search',
-            'owner',
-            'response',
-            'time',
-            'success',
-            'failure',
-            'request',
-            'operation',
-        ]
-    else:  # service
-        key_terms = [
-            'service',
-            'api',
-            'web',
-            'app',
-            'backend',
-            'frontend',
-            'database',
-            'cache',
-            'queue',
-            'worker',
-            'lambda',
-            'function',
-            'microservice',
-        ]
-
-    common_key_terms = 0
-    for term in key_terms:
-        if term in target_normalized and term in candidate_normalized:
-            common_key_terms += 1
+    common_key_terms = len(target_terms & candidate_terms)
 
     if common_key_terms > 0:
         score += common_key_terms * 8  # Up to 8 points per key term
@@ -1,6 +1,7 @@
 """Pytest configuration for CloudWatch Application Signals MCP Server tests."""
 
 import os
+import pytest
 
 
 # Set test environment variables before any imports
@@ -9,3 +10,24 @@ os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'  # pragma: allowlist secret
 os.environ['AWS_SECURITY_TOKEN'] = 'testing'
 os.environ['AWS_SESSION_TOKEN'] = 'testing'
 os.environ.pop('AWS_PROFILE', None)
+
+
+@pytest.fixture(autouse=True)
+def clear_api_cache():
+    """Start every test with an empty AWS API response cache."""
+    from awslabs.cloudwatch_applicationsignals_mcp_server.utils import clear_api_cache
+
+    clear_api_cache()
+    yield
+    clear_api_cache()
+
+
+@pytest.fixture(autouse=True)
+def no_background_client_init():
+    """Keep main() from building real AWS clients on a background thread during tests."""
+    from unittest.mock import patch
+
+    with patch(
+        'awslabs.cloudwatch_applicationsignals_mcp_server.server.initialize_clients_in_background'
+    ) as mock_init:
+        yield mock_init
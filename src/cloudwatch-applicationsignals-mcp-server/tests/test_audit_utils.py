@@ -14,13 +14,20 @@
 
 """Tests for audit_utils module."""
 
+import json
 import os
 import pytest
+import threading
+import time
 from awslabs.cloudwatch_applicationsignals_mcp_server.audit_utils import (
     _compile_wildcard_pattern,
     _fetch_instrumented_services_with_pagination,
     _filter_instrumented_services,
+    _log_json,
+    _log_json_reusing,
     _matches_wildcard_pattern,
+    _resolve_log_path,
+    dedupe_audit_targets,
     execute_audit_api,
     expand_service_operation_wildcard_patterns,
     expand_service_wildcard_patterns,
@@ -104,6 +111,29 @@ class TestExecuteAuditApi:
         assert '"AuditFindings"' in result
         assert mock_applicationsignals_client.list_audit_findings.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_execute_audit_api_opens_log_file_once(self, mock_applicationsignals_client):
+        """Test that the audit log file is opened once for all batches."""
+        input_obj = {
+            'StartTime': 1640995200,
+            'EndTime': 1641081600,
+            'AuditTargets': [
+                {'Type': 'service', 'Data': {'Service': {'Name': f'service-{i}'}}}
+                for i in range(12)  # 12 targets = 3 batches
+            ],
+        }
+        mock_applicationsignals_client.list_audit_findings.side_effect = [
+            {'AuditFindings': [{'FindingId': 'finding-1'}]},
+            {'AuditFindings': []},
+            Exception('API Error'),
+        ]
+
+        with patch('builtins.open', mock_open()) as mocked_open:
+            await execute_audit_api(input_obj, 'us-east-1', 'Test Banner\n')
+
+        mocked_open.assert_called_once()
+        mocked_open.return_value.close.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_execute_audit_api_no_findings(
         self, mock_applicationsignals_client, sample_input_obj
@@ -119,6 +149,34 @@ class TestExecuteAuditApi:
         # The actual implementation returns empty AuditFindings array, not TotalFindingsCount
         assert '"AuditFindings": []' in result
 
+    @pytest.mark.asyncio
+    async def test_execute_audit_api_log_sections(
+        self, mock_applicationsignals_client, sample_input_obj
+    ):
+        """Test that the log file keeps the parameters block with epoch times and the payload."""
+        mock_applicationsignals_client.list_audit_findings.return_value = {'AuditFindings': []}
+
+        with patch('builtins.open', mock_open()) as mocked_open:
+            await execute_audit_api(sample_input_obj, 'us-east-1', 'Test Banner\n')
+
+        written = ''.join(call.args[0] for call in mocked_open().write.call_args_list)
+        parameters, payload = written.split('---- API PARAMETERS (JSON) ----\n')[1].split(
+            '\n---- ACTUAL AWS API PAYLOAD ----\n'
+        )
+        payload = payload.split('\n---- END PARAMETERS ----')[0]
+        assert json.loads(parameters) == {
+            'StartTime': 1640995200,
+            'EndTime': 1641081600,
+            'AuditTargets': sample_input_obj['AuditTargets'],
+            'Auditors': ['slo', 'operation_metric'],
+        }
+        assert json.loads(payload) == {
+            'StartTime': '2022-01-01T00:00:00+00:00',
+            'EndTime': '2022-01-02T00:00:00+00:00',
+            'AuditTargets': sample_input_obj['AuditTargets'],
+            'Auditors': ['slo', 'operation_metric'],
+        }
+
     @pytest.mark.asyncio
     async def test_execute_audit_api_error_handling(
         self, mock_applicationsignals_client, sample_input_obj
@@ -141,11 +199,13 @@ class TestExecuteAuditApi:
         mock_applicationsignals_client.list_audit_findings.return_value = mock_response
 
         # Test with custom log path
+        _resolve_log_path.cache_clear()
         with patch.dict(os.environ, {'AUDITOR_LOG_PATH': '/custom/path'}):
             with patch('os.makedirs') as mock_makedirs:
                 with patch('builtins.open', mock_open()):
                     await execute_audit_api(sample_input_obj, 'us-east-1', 'Test Banner\n')
                     mock_makedirs.assert_called()
+        _resolve_log_path.cache_clear()
 
     @pytest.mark.asyncio
     async def test_execute_audit_api_batch_errors_aggregation(
@@ -176,6 +236,38 @@ class TestExecuteAuditApi:
         assert 'API call failed: API Error for batch 2' in result
         assert 'finding-1' in result  # Successful batch findings still included
 
+    @pytest.mark.asyncio
+    async def test_execute_audit_api_batches_run_concurrently(
+        self, mock_applicationsignals_client
+    ):
+        """Test that batches run concurrently and findings keep batch order."""
+        input_obj = {
+            'StartTime': 1640995200,
+            'EndTime': 1641081600,
+            'AuditTargets': [
+                {'Type': 'service', 'Data': {'Service': {'Name': f'service-{i}'}}}
+                for i in range(10)  # 10 targets = 2 batches
+            ],
+        }
+        both_batches_started = threading.Barrier(2, timeout=5)
+
+        def list_audit_findings(**kwargs):
+            # Both batches must be in flight at once for the barrier to release
+            both_batches_started.wait()
+            first_name = kwargs['AuditTargets'][0]['Data']['Service']['Name']
+            if first_name == 'service-0':
+                time.sleep(0.05)  # Finish the first batch last
+            return {'AuditFindings': [{'FindingId': f'finding-{first_name}'}]}
+
+        mock_applicationsignals_client.list_audit_findings.side_effect = list_audit_findings
+
+        with patch('builtins.open', mock_open()):
+            result = await execute_audit_api(input_obj, 'us-east-1', 'Test Banner\n')
+
+        assert 'ListAuditFindingsErrors' not in result
+        assert result.index('finding-service-0') < result.index('finding-service-5')
+        assert mock_applicationsignals_client.list_audit_findings.call_count == 2
+
     @pytest.mark.asyncio
     async def test_execute_audit_api_log_path_exception(
         self, mock_applicationsignals_client, sample_input_obj
@@ -184,6 +276,7 @@ class TestExecuteAuditApi:
         mock_response = {'AuditFindings': []}
         mock_applicationsignals_client.list_audit_findings.return_value = mock_response
 
+        _resolve_log_path.cache_clear()
         with patch.dict(os.environ, {'AUDITOR_LOG_PATH': '/invalid/path'}):
             # Mock os.makedirs to fail on first call but succeed on second (temp dir)
             makedirs_calls = []
@@ -204,6 +297,63 @@ class TestExecuteAuditApi:
                         # Should fallback to temp directory
                         assert result is not None
                         assert len(makedirs_calls) == 2  # First failed, second succeeded
+        _resolve_log_path.cache_clear()
+
+    def test_log_json_compact_by_default(self):
+        """Test that audit log JSON is compact unless pretty output is enabled."""
+        obj = {'AuditTargets': [{'Type': 'service'}]}
+
+        assert _log_json(obj) == '{"AuditTargets":[{"Type":"service"}]}'
+        with patch(
+            'awslabs.cloudwatch_applicationsignals_mcp_server.audit_utils.LOG_PRETTY_JSON', True
+        ):
+            assert _log_json(obj) == json.dumps(obj, indent=2)
+
+    @pytest.mark.parametrize('pretty', [False, True])
+    def test_log_json_reusing_matches_log_json(self, pretty):
+        """Test that splicing a pre-serialized value gives the same text as _log_json."""
+        targets = [{'Type': 'service', 'Data': {'Service': {'Name': 'svc'}}}]
+        obj = {'StartTime': 1, 'AuditTargets': targets, 'Auditors': ['slo']}
+        with patch(
+            'awslabs.cloudwatch_applicationsignals_mcp_server.audit_utils.LOG_PRETTY_JSON', pretty
+        ):
+            assert _log_json_reusing(obj, 'AuditTargets', _log_json(targets)) == _log_json(obj)
+
+    def test_resolve_log_path_cached(self):
+        """Test that the log path is resolved once and then reused."""
+        _resolve_log_path.cache_clear()
+        with patch.dict(os.environ, {'AUDITOR_LOG_PATH': '/custom/path/'}):
+            with patch('os.makedirs') as mock_makedirs:
+                first = _resolve_log_path()
+                second = _resolve_log_path()
+
+        assert first == second == os.path.join('/custom/path/', 'aws_api.log')
+        mock_makedirs.assert_called_once()
+        _resolve_log_path.cache_clear()
+
+
+class TestDedupeAuditTargets:
+    """Test dedupe_audit_targets function."""
+
+    def test_drops_repeated_targets_keeping_order(self):
+        """Test that identical targets are kept once, regardless of key order."""
+        payment = {'Type': 'service', 'Data': {'Service': {'Name': 'payment', 'Type': 'Service'}}}
+        payment_reordered = {
+            'Data': {'Service': {'Type': 'Service', 'Name': 'payment'}},
+            'Type': 'service',
+        }
+        orders = {'Type': 'service', 'Data': {'Service': {'Name': 'orders', 'Type': 'Service'}}}
+
+        assert dedupe_audit_targets([payment, orders, payment_reordered]) == [payment, orders]
+
+    def test_keeps_distinct_targets(self):
+        """Test that targets differing in any field are all kept."""
+        targets = [
+            {'Type': 'slo', 'Data': {'Slo': {'SloName': 'a'}}},
+            {'Type': 'slo', 'Data': {'Slo': {'SloName': 'b'}}},
+        ]
+
+        assert dedupe_audit_targets(targets) == targets
 
 
 class TestParseAuditors:
@@ -1497,7 +1647,12 @@ class TestExpandServiceWildcardPatterns:
         assert filtering_stats['instrumented_services'] == 0
         assert filtering_stats['filtered_out'] == 0
 
-    @patch('awslabs.cloudwatch_applicationsignals_mcp_server.utils.calculate_name_similarity')
+        # No service targets means no AWS calls at all
+        mock_applicationsignals_client.list_services.assert_not_called()
+
+    @patch(
+        'awslabs.cloudwatch_applicationsignals_mcp_server.audit_utils.calculate_name_similarity'
+    )
     def test_expand_service_fuzzy_matching(self, mock_similarity, mock_applicationsignals_client):
         """Test fuzzy matching for inexact service names."""
         mock_similarity.return_value = 90  # High similarity score
@@ -2082,6 +2237,43 @@ class TestExpandSloWildcardPatterns:
         assert 'payment-latency-slow-slo-prod' in slo_names
         assert 'user-availability-metric' not in slo_names
 
+    def test_expand_slo_wildcard_overlapping_patterns(self, mock_applicationsignals_client):
+        """Test that an SLO matched by several wildcard patterns is expanded once."""
+        targets = [
+            {'Type': 'slo', 'Data': {'Slo': {'SloName': '*payment*'}}},
+            {'Type': 'slo', 'Data': {'Slo': {'SloName': '*availability*'}}},
+        ]
+
+        expanded_targets, _, _ = expand_slo_wildcard_patterns(
+            targets, applicationsignals_client=mock_applicationsignals_client
+        )
+
+        slo_names = [t['Data']['Slo']['SloName'] for t in expanded_targets]
+        assert slo_names == [
+            'payment-latency-slo',
+            'payment-availability-slo',
+            'user-availability-slo',
+        ]
+        mock_applicationsignals_client.list_service_level_objectives.assert_called_once()
+
+    @patch('awslabs.cloudwatch_applicationsignals_mcp_server.audit_utils.logger')
+    def test_expand_slo_wildcard_overlapping_patterns_logging(
+        self, mock_logger, mock_applicationsignals_client
+    ):
+        """Test that each pattern logs its full match count alongside its new unique targets."""
+        targets = [
+            {'Type': 'slo', 'Data': {'Slo': {'SloName': '*payment*'}}},
+            {'Type': 'slo', 'Data': {'Slo': {'SloName': '*availability*'}}},
+        ]
+
+        expand_slo_wildcard_patterns(
+            targets, applicationsignals_client=mock_applicationsignals_client
+        )
+
+        message = "SLO pattern '{}' matched {} SLOs ({} new unique targets)"
+        mock_logger.debug.assert_any_call(message, '*payment*', 2, 2)
+        mock_logger.debug.assert_any_call(message, '*availability*', 2, 1)
+
     def test_expand_slo_no_wildcard(self, mock_applicationsignals_client):
         """Test with no SLO wildcard patterns."""
         targets = [{'Type': 'slo', 'Data': {'Slo': {'SloName': 'exact-slo'}}}]
@@ -2095,6 +2287,35 @@ class TestExpandSloWildcardPatterns:
         assert next_token is None
         assert len(slo_names_in_batch) == 0  # No API call made for non-wildcard
 
+    def test_expand_without_wildcards_skips_default_client(self):
+        """Test that explicit or empty targets expand without resolving the default client."""
+        slo_targets = [{'Type': 'slo', 'Data': {'Slo': {'SloName': 'exact-slo'}}}]
+        operation_targets = [
+            {
+                'Type': 'service_operation',
+                'Data': {
+                    'ServiceOperation': {
+                        'Service': {'Name': 'payment-service'},
+                        'Operation': 'GET /pay',
+                        'MetricType': 'Latency',
+                    }
+                },
+            }
+        ]
+
+        with patch(
+            'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients.applicationsignals_client'
+        ) as mock_default_client:
+            assert expand_slo_wildcard_patterns(slo_targets)[0] == slo_targets
+            assert expand_slo_wildcard_patterns([]) == ([], None, [])
+            assert (
+                expand_service_operation_wildcard_patterns(operation_targets, 0, 0)[0]
+                == operation_targets
+            )
+            assert expand_service_wildcard_patterns([], 0, 0)[0] == []
+
+        assert mock_default_client.mock_calls == []
+
     def test_expand_slo_invalid_format_string(self, mock_applicationsignals_client):
         """Test handling invalid SLO format (string instead of dict)."""
         targets = [{'Type': 'slo', 'Data': {'Slo': 'invalid-string-format'}}]
@@ -2332,6 +2553,128 @@ class TestExpandServiceOperationWildcardPatterns:
         assert next_token is None
         assert len(service_names_in_batch) == 1
 
+    def test_expand_service_operation_shared_service_fetched_once(
+        self, mock_applicationsignals_client
+    ):
+        """Test that operations are fetched once when several patterns match the same service."""
+        targets = [
+            {
+                'Type': 'service_operation',
+                'Data': {
+                    'ServiceOperation': {
+                        'Service': {'Name': '*payment*'},
+                        'Operation': '*GET*',
+                        'MetricType': 'Latency',
+                    }
+                },
+            },
+            {
+                'Type': 'service_operation',
+                'Data': {
+                    'ServiceOperation': {
+                        'Service': {'Name': 'payment-*'},
+                        'Operation': '*POST*',
+                        'MetricType': 'Latency',
+                    }
+                },
+            },
+        ]
+
+        expanded_targets, _, _, _ = expand_service_operation_wildcard_patterns(
+            targets,
+            1640995200,
+            1641081600,
+            applicationsignals_client=mock_applicationsignals_client,
+        )
+
+        operation_names = [t['Data']['ServiceOperation']['Operation'] for t in expanded_targets]
+        assert operation_names == ['GET /payments', 'POST /payments']
+        mock_applicationsignals_client.list_service_operations.assert_called_once()
+
+    def test_expand_service_operation_dedupes_by_key_attributes(
+        self, mock_applicationsignals_client
+    ):
+        """Test that duplicate service summaries share one list_service_operations call."""
+        key_attributes = {'Name': 'payment-service', 'Type': 'Service', 'Environment': 'prod'}
+        mock_applicationsignals_client.list_services.return_value = {
+            'ServiceSummaries': [
+                {'KeyAttributes': dict(key_attributes)},
+                {'KeyAttributes': dict(key_attributes)},
+            ]
+        }
+        targets = [
+            {
+                'Type': 'service_operation',
+                'Data': {
+                    'ServiceOperation': {
+                        'Service': {'Name': 'payment-*'},
+                        'Operation': '*GET*',
+                        'MetricType': 'Latency',
+                    }
+                },
+            }
+        ]
+
+        expand_service_operation_wildcard_patterns(
+            targets,
+            1640995200,
+            1641081600,
+            max_results=10,
+            applicationsignals_client=mock_applicationsignals_client,
+        )
+
+        mock_applicationsignals_client.list_service_operations.assert_called_once()
+
+    def test_expand_service_operation_fetches_services_concurrently(
+        self, mock_applicationsignals_client
+    ):
+        """Test that operations for multiple matched services are fetched in parallel."""
+        mock_applicationsignals_client.list_services.return_value = {
+            'ServiceSummaries': [
+                {'KeyAttributes': {'Name': 'payment-a', 'Type': 'Service', 'Environment': 'prod'}},
+                {'KeyAttributes': {'Name': 'payment-b', 'Type': 'Service', 'Environment': 'prod'}},
+            ]
+        }
+        barrier = threading.Barrier(2, timeout=5)
+
+        def list_service_operations(**kwargs):
+            # Both calls must be in flight at once to pass the barrier
+            barrier.wait()
+            return {
+                'ServiceOperations': [
+                    {'Name': 'GET /pay', 'MetricReferences': [{'MetricType': 'LATENCY'}]}
+                ]
+            }
+
+        mock_applicationsignals_client.list_service_operations.side_effect = (
+            list_service_operations
+        )
+        targets = [
+            {
+                'Type': 'service_operation',
+                'Data': {
+                    'ServiceOperation': {
+                        'Service': {'Name': 'payment-*'},
+                        'Operation': '*',
+                        'MetricType': 'Latency',
+                    }
+                },
+            }
+        ]
+
+        expanded_targets, _, _, _ = expand_service_operation_wildcard_patterns(
+            targets,
+            1640995200,
+            1641081600,
+            max_results=10,
+            applicationsignals_client=mock_applicationsignals_client,
+        )
+
+        service_names = [
+            t['Data']['ServiceOperation']['Service']['Name'] for t in expanded_targets
+        ]
+        assert service_names == ['payment-a', 'payment-b']
+
     def test_expand_service_operation_specific_operation(self, mock_applicationsignals_client):
         """Test expanding with specific operation pattern."""
         targets = [
@@ -2586,6 +2929,7 @@ class TestExpandServiceOperationWildcardPatterns:
         assert expanded_targets[0]['Type'] == 'service'
         assert next_token is None
         assert len(service_names_in_batch) == 0
+        mock_applicationsignals_client.list_services.assert_not_called()
 
     def test_expand_service_operation_fault_to_availability_conversion(
         self, mock_applicationsignals_client
@@ -3089,6 +3433,18 @@ class TestCompileAndMatchesWildcardPattern:
         assert not _matches_wildcard_pattern('exact-match-extra', pattern)
         assert not _matches_wildcard_pattern('prefix-exact-match', pattern)
 
+    def test_match_all_patterns_share_one_compiled_pattern(self):
+        """Test that empty and all-wildcard patterns map to the match-all fast path."""
+        match_all = _compile_wildcard_pattern('*')
+        assert _compile_wildcard_pattern('**') is match_all
+        assert _compile_wildcard_pattern('') is match_all
+        assert _matches_wildcard_pattern('any-service', match_all)
+        assert _matches_wildcard_pattern(None, match_all)
+
+    def test_compiled_pattern_is_memoized(self):
+        """Test that compiling the same wildcard twice returns the cached regex."""
+        assert _compile_wildcard_pattern('*payment*') is _compile_wildcard_pattern('*payment*')
+
     def test_case_insensitive_matching(self):
         """Test that wildcard matching is case insensitive."""
         pattern = _compile_wildcard_pattern('hello')
@@ -123,10 +123,10 @@ def test_initialize_aws_clients_with_profile():
 
     with patch.dict(os.environ, {'AWS_PROFILE': 'test-profile', 'AWS_REGION': 'us-east-1'}):
         with patch(
-            'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients.boto3.Session',
+            'boto3.Session',
             mock_session,
         ):
-            with patch('awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients.Config'):
+            with patch('botocore.config.Config'):
                 # Call the initialization function
                 (
                     logs,
@@ -161,6 +161,25 @@ def test_initialize_aws_clients_with_profile():
                 assert xray == mock_client
 
 
+def test_initialize_aws_clients_without_profile_uses_shared_session():
+    """Test that all clients share one session when AWS_PROFILE is not set."""
+    from awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients import (
+        _initialize_aws_clients,
+    )
+
+    with patch.dict(os.environ, {'AWS_REGION': 'us-east-1'}):
+        os.environ.pop('AWS_PROFILE', None)
+        with patch('boto3.Session') as mock_session:
+            with patch('botocore.config.Config'):
+                clients = _initialize_aws_clients()
+
+                mock_session.assert_called_once()
+                assert mock_session.call_args.kwargs['profile_name'] is None
+                mock_session.return_value.get_credentials.assert_called_once()
+                assert mock_session.return_value.client.call_count == 9
+                assert len(clients) == 9
+
+
 def test_initialize_aws_clients_with_mcp_source():
     """Test _initialize_aws_clients function with MCP_RUN_FROM set."""
     from awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients import (
@@ -168,10 +187,8 @@ def test_initialize_aws_clients_with_mcp_source():
     )
 
     with patch.dict(os.environ, {'MCP_RUN_FROM': 'test-caller', 'AWS_REGION': 'us-east-1'}):
-        with patch(
-            'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients.Config'
-        ) as mock_config:
-            with patch('boto3.client'):
+        with patch('botocore.config.Config') as mock_config:
+            with patch('boto3.Session'):
                 _initialize_aws_clients()
 
                 # Verify Config was called with MCP_RUN_FROM in user agent
@@ -182,3 +199,19 @@ def test_initialize_aws_clients_with_mcp_source():
                     user_agent
                     == f'awslabs.cloudwatch-applicationsignals-mcp-server/{__version__}/test-caller'
                 )
+                assert call_args.kwargs['max_pool_connections'] == 50
+                assert call_args.kwargs['tcp_keepalive'] is True
+
+
+def test_initialize_aws_clients_pool_size_override():
+    """Test that MCP_AWS_POOL_SIZE sets the client connection pool size."""
+    from awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients import (
+        _initialize_aws_clients,
+    )
+
+    with patch.dict(os.environ, {'MCP_AWS_POOL_SIZE': '32'}):
+        with patch('botocore.config.Config') as mock_config:
+            with patch('boto3.Session'):
+                _initialize_aws_clients()
+
+                assert mock_config.call_args.kwargs['max_pool_connections'] == 32
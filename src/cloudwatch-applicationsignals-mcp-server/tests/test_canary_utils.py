@@ -156,6 +156,8 @@ def test_check_resource_arns_correct(mock_canary_clients, s3_location, expected_
         ('cw-syn-results-123456789012-us-east-1', 'cw-syn-results-123456789012-us-east-1', True),
         ('cw-syn-results-123456789012-us-east-1', 'cw-syn-results-*-us-east-1', True),
         ('wrong-bucket', 'cw-syn-results-*-us-east-1', False),
+        ('cw-syn-results-123-us-east-1', 'cw-syn-results-*.us-east-1', False),
+        ('my.bucket.logs', 'my.bucket.*', True),
     ],
 )
 def test_matches_bucket_pattern(actual_bucket, pattern, expected):
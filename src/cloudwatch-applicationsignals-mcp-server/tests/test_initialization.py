@@ -2,7 +2,7 @@
 
 import pytest
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 def test_aws_client_initialization_error():
@@ -12,14 +12,179 @@ def test_aws_client_initialization_error():
     if module_name in sys.modules:
         del sys.modules[module_name]
 
-    with patch(
-        'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients.boto3.client'
-    ) as mock_boto:
-        mock_boto.side_effect = Exception('Failed to initialize AWS client')
+    with patch('boto3.Session') as mock_session:
+        mock_session.return_value.client.side_effect = Exception('Failed to initialize AWS client')
+
+        # Clients are created lazily, so the first client call fails, not the import
+        import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients as aws_clients
 
-        # Import should fail due to client initialization error
         with pytest.raises(Exception, match='Failed to initialize AWS client'):
-            import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients  # noqa: F401
+            aws_clients.logs_client.describe_log_groups
+
+
+def test_aws_clients_initialized_lazily_once():
+    """Test that importing creates no clients and the first client call creates them once."""
+    module_name = 'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients'
+    if module_name in sys.modules:
+        del sys.modules[module_name]
+
+    with patch('boto3.Session') as mock_session:
+        import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients as aws_clients
+
+        # Binding a client by name builds nothing; only using it does
+        from awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients import logs_client
+
+        assert mock_session.call_count == 0
+        assert aws_clients._clients_singleton is None
+
+        logs_client.describe_log_groups(limit=1)
+        aws_clients.xray_client.get_trace_summaries
+        mock_session.assert_called_once()
+        assert mock_session.return_value.client.call_count == 9
+
+        with pytest.raises(AttributeError):
+            aws_clients.unknown_client
+
+        # Resetting drops the cached clients so the next call builds a fresh set
+        aws_clients._reset_clients()
+        logs_client.describe_log_groups(limit=1)
+        assert mock_session.call_count == 2
+
+
+def test_server_import_builds_no_clients():
+    """Test that importing the server and every tool module leaves boto3 unloaded."""
+    import subprocess
+
+    code = (
+        'import sys\n'
+        'import awslabs.cloudwatch_applicationsignals_mcp_server.server\n'
+        'from awslabs.cloudwatch_applicationsignals_mcp_server import aws_clients\n'
+        'assert aws_clients._clients_singleton is None\n'
+        "assert 'boto3' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_aws_clients_initialized_once_across_threads():
+    """Test that concurrent first accesses from several threads build the clients once."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    module_name = 'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients'
+    if module_name in sys.modules:
+        del sys.modules[module_name]
+
+    with patch('boto3.Session') as mock_session:
+        import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients as aws_clients
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: aws_clients._get_clients(), range(16)))
+
+        assert all(client is clients[0] for client in clients)
+        mock_session.assert_called_once()
+
+
+def test_aws_client_initialization_failure_is_not_cached():
+    """Test that a failed initialization is retried on the next client call."""
+    from botocore.exceptions import CredentialRetrievalError
+
+    module_name = 'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients'
+    if module_name in sys.modules:
+        del sys.modules[module_name]
+
+    with patch('boto3.Session') as mock_session:
+        import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients as aws_clients
+
+        mock_session.return_value.get_credentials.side_effect = CredentialRetrievalError(
+            provider='custom-process', error_msg='timed out'
+        )
+        with pytest.raises(CredentialRetrievalError):
+            aws_clients.logs_client.describe_log_groups
+        assert aws_clients._clients_singleton is None
+
+        # Once credentials are available the next call succeeds
+        mock_session.return_value.get_credentials.side_effect = None
+        assert aws_clients.logs_client.describe_log_groups is not None
+        assert mock_session.call_count == 2
+
+
+async def test_call_in_thread_initializes_clients_off_the_event_loop():
+    """Test that a first client call builds the clients in a worker, not on the loop thread."""
+    import threading
+
+    module_name = 'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients'
+    if module_name in sys.modules:
+        del sys.modules[module_name]
+
+    init_threads = []
+
+    def _record_session(**kwargs):
+        init_threads.append(threading.current_thread())
+        return MagicMock()
+
+    with patch('boto3.Session', side_effect=_record_session):
+        import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients as aws_clients
+
+        await aws_clients.call_in_thread(aws_clients.logs_client, 'describe_log_groups', limit=1)
+
+    assert len(init_threads) == 1
+    assert init_threads[0] is not threading.current_thread()
+
+
+def test_initialize_clients_in_background_runs_on_daemon_thread():
+    """Test that startup initialization runs on its own thread and swallows failures."""
+    import threading
+    from awslabs.cloudwatch_applicationsignals_mcp_server import aws_clients
+
+    init_threads = []
+
+    def _failing_init():
+        init_threads.append(threading.current_thread())
+        raise RuntimeError('no credentials yet')
+
+    with patch.object(aws_clients, '_get_clients', side_effect=_failing_init):
+        thread = aws_clients.initialize_clients_in_background()
+        thread.join(timeout=5)
+
+    assert thread.daemon
+    assert init_threads == [thread]
+
+
+def test_prewarm_connections_ignores_errors():
+    """Test that connection pre-warming calls each endpoint and swallows failures."""
+    from awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients import (
+        _prewarm_connections,
+    )
+
+    clients = {
+        'applicationsignals_client': MagicMock(),
+        'cloudwatch_client': MagicMock(),
+        'logs_client': MagicMock(),
+    }
+    clients['applicationsignals_client'].list_service_level_objectives.side_effect = Exception(
+        'AccessDenied'
+    )
+
+    _prewarm_connections(clients).join(timeout=5)
+
+    clients['applicationsignals_client'].list_service_level_objectives.assert_called_once()
+    clients['cloudwatch_client'].describe_alarms.assert_called_once_with(MaxRecords=1)
+    clients['logs_client'].describe_log_groups.assert_called_once_with(limit=1)
+
+
+def test_startup_initialization_starts_prewarm_when_enabled():
+    """Test that startup initialization pre-warms connections when MCP_AWS_PREWARM is set."""
+    module_name = 'awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients'
+    if module_name in sys.modules:
+        del sys.modules[module_name]
+
+    with patch('boto3.Session'), patch.dict('os.environ', {'MCP_AWS_PREWARM': 'true'}):
+        import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients as aws_clients
+
+        with patch.object(aws_clients, '_prewarm_connections') as mock_prewarm:
+            aws_clients.initialize_clients_in_background().join(timeout=5)
+
+        mock_prewarm.assert_called_once_with(aws_clients._clients_singleton)
 
 
 def test_synthetics_endpoint_logging():
@@ -34,11 +199,13 @@ def test_synthetics_endpoint_logging():
     with patch.dict('os.environ', {'MCP_SYNTHETICS_ENDPOINT': 'https://synthetics.test.com'}):
         with patch('loguru.logger') as mock_logger:
             with patch('boto3.client'), patch('boto3.Session'):
-                # Import the module which will trigger initialization
-                import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients  # noqa: F401
+                # Using a client triggers the lazy initialization
+                import awslabs.cloudwatch_applicationsignals_mcp_server.aws_clients as aws_clients
+
+                aws_clients.logs_client.describe_log_groups
 
                 mock_logger.debug.assert_any_call(
-                    'Using Synthetics endpoint override: https://synthetics.test.com'
+                    'Using {} endpoint override: {}', 'Synthetics', 'https://synthetics.test.com'
                 )
 
 
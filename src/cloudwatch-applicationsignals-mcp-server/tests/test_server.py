@@ -822,10 +822,12 @@ async def test_search_transaction_spans_timeout(mock_aws_clients):
                 assert 'did not complete within 30 seconds' in result['message']
 
 
-def test_main_normal_execution(mock_mcp):
+def test_main_normal_execution(mock_mcp, no_background_client_init):
     """Test normal execution of main function."""
     main()
     mock_mcp.run.assert_called_once_with(transport='stdio')
+    # AWS clients start building off the event loop before the server runs
+    no_background_client_init.assert_called_once_with()
 
 
 def test_main_keyboard_interrupt(mock_mcp):
@@ -3172,6 +3174,59 @@ def test_filter_operation_targets_multiple_fault_conversions():
     assert has_wildcards is False
 
 
+@pytest.mark.parametrize(
+    'service_operation,message',
+    [
+        (None, 'Data.ServiceOperation must be an object'),
+        ({'Operation': 'GET /'}, 'Service must be an object'),
+        ({'Service': 'payment', 'Operation': 'GET /'}, 'Service must be an object'),
+        ({'Service': {'Name': 'payment'}}, 'Operation is required'),
+    ],
+)
+def test_filter_operation_targets_rejects_malformed_targets(service_operation, message):
+    """Test _filter_operation_targets rejects malformed targets before any expansion."""
+    provided = [
+        {'Type': 'service_operation', 'Data': {'ServiceOperation': service_operation}},
+    ]
+
+    with pytest.raises(ValueError, match=rf'operation_targets\[1\]: .*{message}'):
+        _filter_operation_targets(provided)
+
+
+def test_filter_operation_targets_accepts_service_without_name():
+    """Test services identified by KeyAttributes other than Name pass through to the API."""
+    provided = [
+        {
+            'Type': 'service_operation',
+            'Data': {
+                'ServiceOperation': {
+                    'Service': {
+                        'Type': 'AWS::Resource',
+                        'ResourceType': 'AWS::DynamoDB::Table',
+                        'Identifier': 'orders',
+                        'Environment': 'us-east-1',
+                    },
+                    'Operation': 'GetItem',
+                    'MetricType': 'Latency',
+                }
+            },
+        },
+        {'Type': 'service', 'Data': {'Service': {'Name': 'skipped'}}},
+        {
+            'Type': 'service_operation',
+            'Data': {'ServiceOperation': {'Service': {'Name': 'payment'}}},
+        },
+    ]
+
+    # The Name-less target is accepted; the error points at the third item, 1-based
+    with pytest.raises(ValueError, match=r'operation_targets\[3\]: .*Operation is required'):
+        _filter_operation_targets(provided)
+
+    operation_targets, has_wildcards = _filter_operation_targets(provided[:1])
+    assert operation_targets == provided[:1]
+    assert has_wildcards is False
+
+
 def test_filter_operation_targets_with_wildcards():
     """Test _filter_operation_targets detects wildcards and converts Fault to Availability."""
     provided = [
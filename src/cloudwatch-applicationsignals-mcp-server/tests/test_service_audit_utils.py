@@ -59,6 +59,12 @@ class TestCiGet:
         result = _ci_get({}, 'Name')
         assert result is None
 
+    def test_ci_get_case_insensitive_respects_name_order(self):
+        """Test case insensitive fallback prefers earlier names over later ones."""
+        data = {'AWS_ACCOUNT_ID': '222222222222', 'AWSACCOUNTID': '111111111111'}
+        result = _ci_get(data, 'AwsAccountId', 'aws_account_id')
+        assert result == '111111111111'
+
 
 class TestNeed:
     """Test _need function."""
@@ -122,6 +128,9 @@ class TestCoerceServiceTarget:
             },
         }
         assert result == expected
+        # The caller's payload is read in place and left untouched
+        assert target['Data']['Service'] == {'Name': 'test-service', 'Environment': 'prod'}
+        assert result['Data']['Service'] is not target['Data']['Service']
 
     def test_coerce_with_aws_account_id(self):
         """Test coercing with AWS account ID."""
@@ -357,6 +366,65 @@ class TestValidateAndEnrichServiceTargets:
         assert result[0]['Data']['Service']['Environment'] == 'eks:test-cluster/default'
         mock_applicationsignals_client.list_services.assert_called_once()
 
+    def test_validate_enrich_lists_services_once(self, mock_applicationsignals_client):
+        """Test that several targets missing environment share one list_services call."""
+        targets = [
+            {'Type': 'service', 'Data': {'Service': {'Name': 'test-service'}}},
+            {'Type': 'service', 'Data': {'Service': {'Name': 'test-service', 'Type': 'Service'}}},
+        ]
+
+        result = validate_and_enrich_service_targets(
+            targets, mock_applicationsignals_client, 1640995200, 1641081600
+        )
+        # A repeat call in the same window is served from the API cache
+        validate_and_enrich_service_targets(
+            targets, mock_applicationsignals_client, 1640995200, 1641081600
+        )
+
+        assert len(result) == 2
+        assert all(
+            t['Data']['Service']['Environment'] == 'eks:test-cluster/default' for t in result
+        )
+        mock_applicationsignals_client.list_services.assert_called_once()
+
+    def test_validate_enrich_finds_service_on_later_page(self, mock_applicationsignals_client):
+        """Test that enrichment follows NextToken past the first page of services."""
+        mock_applicationsignals_client.list_services.side_effect = [
+            {
+                'ServiceSummaries': [{'KeyAttributes': {'Name': 'other', 'Environment': 'x'}}],
+                'NextToken': 'page-2',
+            },
+            {
+                'ServiceSummaries': [
+                    {'KeyAttributes': {'Name': 'late-service', 'Environment': 'eks:c/ns'}}
+                ]
+            },
+        ]
+        targets = [{'Type': 'service', 'Data': {'Service': {'Name': 'late-service'}}}]
+
+        result = validate_and_enrich_service_targets(
+            targets, mock_applicationsignals_client, 1640995200, 1641081600
+        )
+
+        assert result[0]['Data']['Service']['Environment'] == 'eks:c/ns'
+        assert mock_applicationsignals_client.list_services.call_count == 2
+
+    def test_validate_enrich_prefers_first_listed_service(self, mock_applicationsignals_client):
+        """Test that a name listed in several environments enriches from the first one."""
+        mock_applicationsignals_client.list_services.return_value = {
+            'ServiceSummaries': [
+                {'KeyAttributes': {'Name': 'dup-service', 'Environment': 'eks:first/ns'}},
+                {'KeyAttributes': {'Name': 'dup-service', 'Environment': 'eks:second/ns'}},
+            ]
+        }
+        targets = [{'Type': 'service', 'Data': {'Service': {'Name': 'dup-service'}}}]
+
+        result = validate_and_enrich_service_targets(
+            targets, mock_applicationsignals_client, 1640995200, 1641081600
+        )
+
+        assert result[0]['Data']['Service']['Environment'] == 'eks:first/ns'
+
     def test_validate_wildcard_pattern_error(self, mock_applicationsignals_client):
         """Test error when wildcard pattern found in validation."""
         targets = [{'Type': 'service', 'Data': {'Service': {'Name': '*test*'}}}]
@@ -202,6 +202,24 @@ class TestSLIReportClient:
         assert summaries[1].name == 'slo-2'
         assert summaries[1].operation_name == 'N/A'  # Default when not provided
 
+    def test_get_slo_summaries_follows_next_token(self, mock_aws_clients):
+        """Test that SLO summaries from every page are returned."""
+        config = AWSConfig(service_name='TestService')
+        client = SLIReportClient(config)
+
+        signals_client = mock_aws_clients['signals_client']
+        signals_client.list_service_level_objectives.side_effect = [
+            {'SloSummaries': [{'Name': 'slo-1', 'Arn': 'arn-1'}], 'NextToken': 'page-2'},
+            {'SloSummaries': [{'Name': 'slo-2', 'Arn': 'arn-2'}]},
+        ]
+
+        summaries = client.get_slo_summaries()
+
+        assert [summary.name for summary in summaries] == ['slo-1', 'slo-2']
+        assert signals_client.list_service_level_objectives.call_count == 2
+        second_call = signals_client.list_service_level_objectives.call_args_list[1]
+        assert second_call.kwargs['NextToken'] == 'page-2'
+
     def test_get_slo_summaries_client_error(self, mock_aws_clients):
         """Test get_slo_summaries with ClientError."""
         config = AWSConfig()
@@ -14,12 +14,167 @@
 
 """Tests for utils module."""
 
+import os
+import pytest
 from awslabs.cloudwatch_applicationsignals_mcp_server.utils import (
+    _similarity_features,
     calculate_name_similarity,
+    get_bool_env,
+    get_non_negative_float_env,
+    get_positive_int_env,
     parse_timestamp,
     remove_null_values,
+    ttl_cached,
 )
 from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+
+class TestTtlCached:
+    """Test ttl_cached function."""
+
+    def test_ttl_cached_reuses_result(self):
+        """Test that a second call with the same key does not re-fetch."""
+        fetch = Mock(return_value={'ServiceSummaries': []})
+
+        assert ttl_cached(('list_services', 1), fetch) == {'ServiceSummaries': []}
+        assert ttl_cached(('list_services', 1), fetch) == {'ServiceSummaries': []}
+        ttl_cached(('list_services', 2), fetch)
+
+        assert fetch.call_count == 2
+
+    def test_ttl_cached_disabled(self):
+        """Test that a zero TTL always calls fetch."""
+        fetch = Mock(return_value='value')
+
+        with patch(
+            'awslabs.cloudwatch_applicationsignals_mcp_server.utils.API_CACHE_TTL_SECONDS', 0
+        ):
+            ttl_cached('key', fetch)
+            ttl_cached('key', fetch)
+
+        assert fetch.call_count == 2
+
+    def test_ttl_cached_does_not_cache_errors(self):
+        """Test that exceptions from fetch are not cached."""
+        fetch = Mock(side_effect=[Exception('throttled'), 'value'])
+
+        with pytest.raises(Exception, match='throttled'):
+            ttl_cached('key', fetch)
+
+        assert ttl_cached('key', fetch) == 'value'
+
+    def test_ttl_cached_evicts_least_recently_used(self):
+        """Test that the cache stays bounded and evicts the least recently used key."""
+        from awslabs.cloudwatch_applicationsignals_mcp_server import utils
+
+        fetch = Mock(side_effect=lambda: 'value')
+        with patch.object(utils, 'API_CACHE_MAX_ENTRIES', 2):
+            ttl_cached('a', fetch)
+            ttl_cached('b', fetch)
+            ttl_cached('a', fetch)  # hit; 'b' is now the least recently used
+            ttl_cached('c', fetch)
+
+            assert list(utils._api_cache) == ['a', 'c']
+            ttl_cached('a', fetch)
+        assert fetch.call_count == 3
+
+    def test_ttl_cached_drops_expired_entries_on_insert(self):
+        """Test that expired entries are removed when a new response is stored."""
+        from awslabs.cloudwatch_applicationsignals_mcp_server import utils
+
+        fetch = Mock(return_value='value')
+        with patch.object(utils, 'time') as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 1000.0]
+            ttl_cached(('list_services', 1), fetch)
+            ttl_cached(('list_services', 2), fetch)
+
+        assert list(utils._api_cache) == [('list_services', 2)]
+
+
+class TestGetBoolEnv:
+    """Test get_bool_env function."""
+
+    @pytest.mark.parametrize(
+        'raw,expected',
+        [
+            ('1', True),
+            ('true', True),
+            (' Yes ', True),
+            ('TRUE', True),
+            ('0', False),
+            ('false', False),
+            ('no', False),
+            ('', False),
+        ],
+    )
+    def test_get_bool_env(self, raw, expected):
+        """Test that only explicit true values enable a flag."""
+        with patch.dict('os.environ', {'MCP_TEST_FLAG': raw}):
+            assert get_bool_env('MCP_TEST_FLAG') is expected
+
+    def test_get_bool_env_unset(self):
+        """Test that an unset flag is disabled."""
+        with patch.dict('os.environ', {}):
+            os.environ.pop('MCP_TEST_FLAG', None)
+            assert get_bool_env('MCP_TEST_FLAG') is False
+
+
+class TestGetPositiveIntEnv:
+    """Test get_positive_int_env function."""
+
+    @pytest.mark.parametrize(
+        'raw,expected',
+        [
+            (None, 5),
+            ('8', 8),
+            ('0', 1),
+            ('-3', 1),
+            ('ten', 5),
+            ('', 5),
+        ],
+    )
+    def test_get_positive_int_env(self, raw, expected):
+        """Test unset, valid, non-positive and non-integer values."""
+        env = {} if raw is None else {'MCP_TEST_SETTING': raw}
+        with patch.dict('os.environ', env):
+            if raw is None:
+                os.environ.pop('MCP_TEST_SETTING', None)
+            assert get_positive_int_env('MCP_TEST_SETTING', 5) == expected
+
+
+class TestGetNonNegativeFloatEnv:
+    """Test get_non_negative_float_env function."""
+
+    @pytest.mark.parametrize(
+        'raw,expected',
+        [
+            ('30', 30.0),
+            ('2.5', 2.5),
+            ('0', 0.0),
+            ('-10', 0.0),
+            ('sixty', 60.0),
+            ('', 60.0),
+            ('nan', 60.0),
+            ('inf', 60.0),
+        ],
+    )
+    def test_get_non_negative_float_env(self, raw, expected):
+        """Test valid, non-positive and non-numeric values."""
+        with patch.dict('os.environ', {'MCP_TEST_SECONDS': raw}):
+            assert get_non_negative_float_env('MCP_TEST_SECONDS', 60.0) == expected
+
+    def test_bad_cache_ttl_falls_back_at_import(self):
+        """Test that a non-numeric MCP_APPSIGNALS_CACHE_TTL does not break importing utils."""
+        import importlib
+        from awslabs.cloudwatch_applicationsignals_mcp_server import utils
+
+        try:
+            with patch.dict('os.environ', {'MCP_APPSIGNALS_CACHE_TTL': 'soon'}):
+                importlib.reload(utils)
+                assert utils.API_CACHE_TTL_SECONDS == 60.0
+        finally:
+            importlib.reload(utils)
 
 
 class TestRemoveNullValues:
@@ -42,7 +197,7 @@ class TestRemoveNullValues:
         """Test with dictionary containing no None values."""
         data = {'key1': 'value1', 'key2': 'value2'}
         result = remove_null_values(data)
-        assert result == data
+        assert result is data
 
     def test_remove_null_values_all_nulls(self):
         """Test with dictionary containing only None values."""
@@ -140,6 +295,23 @@ class TestParseTimestamp:
         time_diff = abs((result - expected_time).total_seconds())
         assert time_diff < 5  # Within 5 seconds
 
+    def test_parse_timestamp_memoizes_absolute_formats_only(self):
+        """Test absolute timestamps are memoized while the relative fallback is not."""
+        assert parse_timestamp('2022-01-01T00:00:00Z') is parse_timestamp('2022-01-01T00:00:00Z')
+
+        # The cached parse of an invalid string is a miss; the fallback is still recomputed
+        parse_timestamp('not-a-timestamp', default_hours=1)
+        first_now = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        later_now = first_now + timedelta(minutes=30)
+        with patch('awslabs.cloudwatch_applicationsignals_mcp_server.utils.datetime') as mock_dt:
+            mock_dt.now.side_effect = [first_now, later_now]
+            assert parse_timestamp('not-a-timestamp', default_hours=1) == first_now - timedelta(
+                hours=1
+            )
+            assert parse_timestamp('not-a-timestamp', default_hours=1) == later_now - timedelta(
+                hours=1
+            )
+
 
 class TestCalculateNameSimilarity:
     """Test calculate_name_similarity function."""
@@ -170,6 +342,14 @@ class TestCalculateNameSimilarity:
         assert calculate_name_similarity('test', '') == 0
         assert calculate_name_similarity('', '') == 0
 
+    def test_name_features_are_memoized_per_name_type(self):
+        """Test name features are computed once per name and keyed by name type."""
+        service_features = _similarity_features('Payment_Time.API', 'service')
+        assert service_features is _similarity_features('Payment_Time.API', 'service')
+        assert service_features[1] == 'payment-time-api'
+        assert service_features[3] == frozenset({'api'})
+        assert _similarity_features('Payment_Time.API', 'slo')[3] == frozenset({'time'})
+
     def test_word_based_matching(self):
         """Test word-based matching."""
         result = calculate_name_similarity('payment service api', 'api payment service')